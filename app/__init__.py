@@ -1,9 +1,20 @@
-import os, time
+import os, sys, time
+from pathlib import Path
+from contextlib import nullcontext
 from multiprocessing import Pool
 from itertools import starmap
 from .utils import (Timer, Result, pluralize, console, init_worker,
                     cancel_on_kbinterrupt, console_status, calculate_all_turns,
-                    save_results, get_monopoly_cls, generate_games, play_game)
+                    save_results, get_monopoly_cls, generate_games, play_game,
+                    play_game_until, generate_timed_games,
+                    combine_outputs, make_trace_paths, save_trace_info,
+                    save_turn_distributions, pretty_duration, make_results_dir,
+                    ExportWriter, ENGINES)
+from .markov import TransitionModel
+from .rules import RULES
+from .convergence import convergence_log, CONVERGENCE_START
+from .calibration import available_cpus, load_calibration, plan_games
+from .metrics import collect_metrics, save_metrics, engine_name
 from rich.panel import Panel
 from rich.text import Text
 from rich import box
@@ -23,25 +34,43 @@ if os.getenv("FORCE_NUITKA_MULTI"):
 def parse_args():
     try:
         import argparse
-        parser = argparse.ArgumentParser()
+        parser = argparse.ArgumentParser(epilog="To simulate many scenarios at once, see 'monopoly batch --help'.")
         parser.add_argument("--turns", help="The number of turns to simulate.", type=int, default=100)
+        parser.add_argument("--time-budget", help="Instead of a number of turns, simulate for TIME_BUDGET seconds and take as many turns as fit. The time of each worker starts once its engine is ready, so starting the workers isn't counted.", type=float)
         parser.add_argument("--no-parallel", help="Don't run the simulation in parallel.", action="store_true")
         parser.add_argument("--max-cpu-cores", help="When running in parallel, the maximum number of CPU cores to use for the simulation.", type=int)
-        parser.add_argument("--pure-python", help="Use the pure python version for the simulation.", action="store_true")
+        parser.add_argument("--engine", help="The engine to simulate with. 'lanes' plays several games side by side in each process, it is the fastest but can't record visit stats or traces. 'numba' needs Numba installed, it is for when the C extension can't be built. (Default: 'auto')", choices=ENGINES, default="auto")
+        parser.add_argument("--auto-tune", help="Pick the number of cores and how to split up the turns from a measurement of how fast the engine runs on this machine. The measurement is cached, so it only takes a moment the first time.", action="store_true")
+        parser.add_argument("--recalibrate", help="With --auto-tune, measure again instead of using the cached measurement.", action="store_true")
+        parser.add_argument("--pure-python", help="Use the pure python version for the simulation. (Same as '--engine python')", action="store_true")
         parser.add_argument("--results-dir", help="The directory to store the results from the simulation. (Default: 'results')")
+        parser.add_argument("--store", help="Add the results to the result store in the STORE directory instead of saving them as separate files. Query it with 'python -m app.store'. The metrics of the run are saved in the STORE directory, replacing those of the run before.")
+        parser.add_argument("--rules", help="The rules to play by, 'reference' uses the rules from the standupmaths video. (Default: 'standard')", choices=RULES, default="standard")
+        parser.add_argument("--visit-stats", help="Also record how many turns pass between visits to each square and how long each stay in jail lasts.", action="store_true")
+        parser.add_argument("--convergence-log", help=f"While simulating, write the probabilities so far to a csv file each time the number of moves doubles, starting at {CONVERGENCE_START:,}.", action="store_true")
+        parser.add_argument("--record-trace", help="Record where every turn ends to files in the 'trace' directory of the results (1 byte per turn). Analyze them later with 'python -m app.trace'.", action="store_true")
+        parser.add_argument("--first-turns", help="Instead of simulating, calculate the probabilities for each of the first FIRST_TURNS turns of a game from a Markov model. It draws each card from the full deck (a memoryless-deck approximation of the shuffled decks).", type=int)
         flags = parser.parse_args()
     except ImportError:
         flags = None
     return flags
 
+def parse_batch_args():
+    import argparse
+    parser = argparse.ArgumentParser(prog="monopoly batch", description="Simulate every scenario in a scenarios file, sharing one pool of workers.")
+    parser.add_argument("scenarios", help="A json file with a list of scenarios, like [{\"turns\": 1000000, \"rules\": \"reference\", \"engine\": \"lanes\"}]. Only 'turns' is needed.")
+    parser.add_argument("--no-parallel", help="Don't run the simulations in parallel.", action="store_true")
+    parser.add_argument("--max-cpu-cores", help="When running in parallel, the maximum number of CPU cores to use for the simulations.", type=int)
+    parser.add_argument("--results-dir", help="The directory to store the results in, each scenario gets a directory named after its key. Scenarios that already have one are skipped. (Default: 'results')")
+    parser.add_argument("--store", help="Add the results to the result store in the STORE directory instead. Scenarios that are already in it are skipped.")
+    return parser.parse_args(sys.argv[2:])
+
 def pyoxidizer_main():
     from multiprocessing import freeze_support
     freeze_support()
     main()
 
-def main():
-    flags = parse_args()
-
+def print_title():
     title = Text(r"""    ___  ___                              _
     |  \/  |                             | |            ____
     | .  . | ___  _ __   ___  _ __   ___ | |_   _      /\' .\    _____
@@ -59,41 +88,185 @@ def main():
 """,)
     console.print(Panel(title, box=box.DOUBLE_EDGE, border_style="red"), style="bold white")
     print()
+
+def main():
+    start = time.perf_counter()
+    if sys.argv[1:2] == ["batch"]:
+        batch_main(start)
+        return
+    flags = parse_args()
+
+    print_title()
+    rules = RULES[flags.rules]
+    if rules.name != "standard":
+        console.print(f"-- Using {rules.name.capitalize()} rules --", style="yellow")
+
+    if flags.first_turns:
+        first_turns_main(flags, rules)
+        return
+
+    cpu_count = cores_to_use(flags)
+
+    engine = "python" if flags.pure_python else flags.engine
+    monopoly_cls = get_monopoly_cls(engine, flags.visit_stats or flags.record_trace)
+    min_game_turns = 1000000
+    if flags.auto_tune and cpu_count > 1:
+        with cancel_on_kbinterrupt("[bold red]Calibration cancelled"), console_status("Measuring how fast the simulation runs on this machine"):
+            measurements = load_calibration(monopoly_cls, rules, cpu_count, flags.recalibrate)
+        if flags.time_budget:
+            # Plan for the most turns that could fit in the time
+            planned_turns = int(max(measurement["moves_per_sec"] for measurement in measurements.values())*flags.time_budget)
+        else:
+            planned_turns = flags.turns
+        cpu_count, min_game_turns = plan_games(planned_turns, measurements)
+        console.print(f"-- Auto-tuned to {pluralize(cpu_count,'core')} and at least {min_game_turns:,} moves per game --", style="yellow")
+
+    if flags.time_budget and flags.convergence_log:
+        console.print("-- The convergence log isn't available with a time budget --", style="yellow")
+
     timer = Timer()
     num_cores_used = 0
     with timer:
-        # determine the number of cores to use
-        if flags.no_parallel:
-            cpu_count = 1
+        if flags.time_budget:
+            num_cores_used = cpu_count
+            simulate_text = f"for [{{color}}]{pretty_duration(flags.time_budget)}[/]"
         else:
-            cpu_count = min(flags.max_cpu_cores, os.cpu_count()) if flags.max_cpu_cores else os.cpu_count()
-
-        if NUITKA_BUILD: # Built with Nuitka, multiprocessing does not work, don't use it
-            if cpu_count > 1:
-                console.print("Multi-core support is not currently available with the Nuitka build.", style="yellow")
-                console.print("Running in single core mode.", style="yellow")
-                cpu_count = 1
-
-        monopoly_cls = get_monopoly_cls(pure_python=flags.pure_python)
-        turns = calculate_all_turns(flags.turns, cpu_count)
-        num_cores_used = len(turns)
-        info_template = f"Using [{{color}}]{pluralize(num_cores_used,'core',highlight=True)}[/] to simulate [{{color}}]{pluralize(sum(turns),'move',',',True)}[/]"
+            turns = calculate_all_turns(flags.turns, cpu_count, min_game_turns)
+            num_cores_used = len(turns)
+            simulate_text = f"[{{color}}]{pluralize(sum(turns),'move',',',True)}[/]"
+        info_template = f"Using [{{color}}]{pluralize(num_cores_used,'core',highlight=True)}[/] to simulate {simulate_text}"
         info_text = info_template.format(color="green")
         cancelled_text = info_template.format(color="red") + "[white]...[/][bold red]Cancelled"
-        with cancel_on_kbinterrupt(cancelled_text), console_status(info_text) as status:
-            if len(turns) <= 1 or NUITKA_BUILD:
-                results = [sum(square) for square in zip(*starmap(play_game, generate_games(monopoly_cls, turns)))]
+        parallel = num_cores_used > 1 and not NUITKA_BUILD
+        trace_paths = make_trace_paths(num_cores_used, flags.results_dir) if flags.record_trace else None
+        convergence = convergence_log(turns, flags.results_dir, parallel) if flags.convergence_log and not flags.time_budget else nullcontext()
+        with cancel_on_kbinterrupt(cancelled_text), console_status(info_text) as status, convergence as snapshot_senders:
+            if flags.time_budget:
+                play = play_game_until
+                games = generate_timed_games(monopoly_cls, num_cores_used, flags.time_budget, rules, flags.visit_stats, trace_paths)
             else:
-                with Pool(initializer=init_worker) as pool:
-                    processing = pool.starmap_async(play_game, generate_games(monopoly_cls, turns))
+                play = play_game
+                games = generate_games(monopoly_cls, turns, rules, flags.visit_stats, snapshot_senders, trace_paths)
+            if not parallel:
+                output = combine_outputs(starmap(play, games))
+            else:
+                with Pool(num_cores_used, initializer=init_worker) as pool:
+                    processing = pool.starmap_async(play, games)
                     while not processing.ready():
                         time.sleep(0.1)
-                    results = [sum(square) for square in zip(*processing.get())]
+                    output = combine_outputs(processing.get())
 
-    result = Result(results, timer.duration, num_cores_used)
+    result = Result(output.results, timer.duration, num_cores_used, output.visit_gaps, output.jail_stays)
     console.rule("[bold]Results")
     print()
     console.print(f"# of Cores: {num_cores_used}")
     console.print(f"  Run time: [cyan]{result.pretty_duration()}")
     console.print(f"     Moves: [cyan]{result.pretty_total_turns()}")
-    save_results(result, flags.results_dir)
+    export_timer = Timer()
+    with export_timer:
+        if flags.store:
+            # Imported here so 'python -m app.store' doesn't find it already imported
+            from .store import ResultStore, make_scenario
+            scenario = make_scenario(rules, engine_name(monopoly_cls), None if flags.time_budget else flags.turns, flags.time_budget)
+            key = ResultStore(flags.store).add(scenario, result.results)
+            console.print(f"\n[bold]Added to[/] [magenta]{Path(flags.store).resolve()}[/] as [cyan]{key}")
+        else:
+            save_results(result, flags.results_dir)
+        if trace_paths:
+            save_trace_info(trace_paths, rules)
+    metrics = collect_metrics(result, output.worker_stats, monopoly_cls, rules, start, export_timer.duration)
+    if flags.store:
+        # The metrics of the latest run go in the store's directory
+        console.print(f"\n[bold]Saving metrics in[/] [magenta]{Path(flags.store).resolve()}[/]:")
+        save_metrics(metrics, flags.store)
+    else:
+        save_metrics(metrics, flags.results_dir)
+
+"""
+Returns the number of cores to use, from the flags and the CPUs that are
+available.
+"""
+def cores_to_use(flags):
+    if flags.no_parallel:
+        cpu_count = 1
+    else:
+        cpu_count = min(flags.max_cpu_cores, available_cpus()) if flags.max_cpu_cores else available_cpus()
+
+    if NUITKA_BUILD: # Built with Nuitka, multiprocessing does not work, don't use it
+        if cpu_count > 1:
+            console.print("Multi-core support is not currently available with the Nuitka build.", style="yellow")
+            console.print("Running in single core mode.", style="yellow")
+            cpu_count = 1
+    return cpu_count
+
+"""
+Simulate every scenario in a scenarios file (see `batch.py`). All of the games
+are played by one pool, longest first, and each scenario is saved by the
+`ExportWriter` as soon as its last game is done, while the pool carries on with
+the rest.
+"""
+def batch_main(start):
+    # Imported here so 'python -m app.store' doesn't find it already imported
+    from .batch import (load_scenarios, make_tasks, generate_tasks, play_task,
+                        save_scenario, SCENARIO_INFO)
+    flags = parse_batch_args()
+    print_title()
+    try:
+        scenarios = load_scenarios(flags.scenarios)
+    except (OSError, ValueError) as error:
+        console.print(f"Couldn't load the scenarios: {error}", style="bold red")
+        sys.exit(1)
+
+    if flags.store:
+        from .store import ResultStore
+        store = ResultStore(flags.store)
+        results_dir = None
+        done = set(store.latest())
+    else:
+        store = None
+        results_dir = make_results_dir(flags.results_dir)
+        done = {scenario.key for scenario in scenarios if (results_dir / scenario.key / SCENARIO_INFO).exists()}
+    for scenario in scenarios:
+        if scenario.key in done:
+            console.print(f"-- Skipping {scenario} ({scenario.key}), it is already done --", style="yellow")
+    scenarios = [scenario for scenario in scenarios if scenario.key not in done]
+    if not scenarios:
+        console.print("Every scenario is already done", style="bold green")
+        return
+
+    cpu_count = cores_to_use(flags)
+    tasks = make_tasks(scenarios, cpu_count)
+    num_cores_used = min(cpu_count, len(tasks))
+    parallel = num_cores_used > 1
+    timer = Timer()
+    info_text = f"Using [green]{pluralize(num_cores_used,'core',highlight=True)}[/] to simulate [green]{pluralize(len(scenarios),'scenario',highlight=True)}[/]"
+    cancelled_text = info_text.replace("green", "red") + "[white]...[/][bold red]Cancelled"
+    with timer, cancel_on_kbinterrupt(cancelled_text), console_status(info_text), ExportWriter() as writer:
+        with Pool(num_cores_used, initializer=init_worker) if parallel else nullcontext() as pool:
+            games = generate_tasks(scenarios, tasks)
+            outputs = pool.imap_unordered(play_task, games) if parallel else map(play_task, games)
+            for index, output in outputs:
+                scenario = scenarios[index]
+                scenario.outputs.append(output)
+                if scenario.done:
+                    writer.submit(save_scenario, scenario, results_dir, store, start)
+
+    console.rule("[bold]Results")
+    print()
+    console.print(f"# of Cores: {num_cores_used}")
+    console.print(f"  Run time: [cyan]{pretty_duration(timer.duration)}")
+    console.print(f" Scenarios: [cyan]{len(scenarios)}")
+    console.print(f"     Moves: [cyan]{pluralize(sum(scenario.turns for scenario in scenarios),'move',',')}")
+
+def first_turns_main(flags, rules):
+    timer = Timer()
+    info_text = f"Calculating the probabilities for the first [green]{pluralize(flags.first_turns,'turn',',',True)}[/]"
+    cancelled_text = info_text.replace("green", "red") + "[white]...[/][bold red]Cancelled"
+    with timer, cancel_on_kbinterrupt(cancelled_text), console_status(info_text):
+        distributions = TransitionModel(rules).turn_distributions(flags.first_turns)
+
+    console.rule("[bold]Results")
+    print()
+    console.print(f"  Run time: [cyan]{pretty_duration(timer.duration)}")
+    console.print(f"     Turns: [cyan]{pluralize(len(distributions),'turn',',')}")
+    save_turn_distributions(distributions, flags.results_dir)
@@ -0,0 +1,136 @@
+"""
+Runs many scenarios in one go with `monopoly batch SCENARIOS_FILE`. The scenarios
+file is a json list with an object for each scenario:
+
+[
+    {"turns": 10000000},
+    {"turns": 10000000, "rules": "reference", "engine": "lanes"}
+]
+
+Only "turns" is needed, "rules" defaults to 'standard' and "engine" to 'auto'.
+The games of every scenario are played by the same pool of workers, so it only
+has to be started once.
+"""
+
+import json
+
+from .metrics import engine_name, collect_metrics, save_metrics
+from .rules import RULES
+from .store import make_scenario, scenario_key, describe_scenario
+from .utils import (Timer, Result, console, get_monopoly_cls, play_game,
+                    calculate_all_turns, combine_outputs, save_results, ENGINES)
+
+SCENARIO_INFO = 'scenario.json'
+SCENARIO_FIELDS = {"turns", "rules", "engine"}
+
+# Roughly how many moves a second a game plays with each engine. Only used to
+# put the games in order, so it doesn't need to be right for every machine.
+ENGINE_MOVES_PER_SEC = {"python": 1e6, "python-fast": 3e6, "cython": 8e6, "lanes": 60e6, "numba": 60e6}
+
+class Scenario(object):
+    def __init__(self, rules, monopoly_cls, turns):
+        self.rules = rules
+        self.monopoly_cls = monopoly_cls
+        self.turns = turns
+        self.engine = engine_name(monopoly_cls)
+        self.info = make_scenario(rules, self.engine, turns)
+        self.key = scenario_key(self.info)
+        self.games = 0
+        self.outputs = []
+
+    def __str__(self):
+        return describe_scenario(self.info)
+
+    @property
+    def done(self):
+        return len(self.outputs) == self.games
+
+"""
+Loads the scenarios from the scenarios file at `path`. Each engine is only looked
+up once, so its notes are only printed once. The same scenario is only loaded
+once even if it is in the file more than once.
+
+Raises ValueError if the file isn't a list of scenarios.
+"""
+def load_scenarios(path):
+    with open(path) as scenarios_file:
+        entries = json.load(scenarios_file)
+    if not isinstance(entries, list):
+        raise ValueError("The scenarios file should have a list of scenarios")
+    engines = {}
+    scenarios = {}
+    for number, entry in enumerate(entries, 1):
+        if not isinstance(entry, dict):
+            raise ValueError(f"Scenario {number} should be an object")
+        unknown = set(entry) - SCENARIO_FIELDS
+        if unknown:
+            raise ValueError(f"Scenario {number} has unknown fields: {', '.join(sorted(unknown))}")
+        turns = entry.get("turns")
+        if not isinstance(turns, int) or turns < 1:
+            raise ValueError(f"Scenario {number} needs a positive number of turns")
+        rules_name = entry.get("rules", "standard")
+        if rules_name not in RULES:
+            raise ValueError(f"Scenario {number} has unknown rules '{rules_name}', pick from: {', '.join(RULES)}")
+        engine = entry.get("engine", "auto")
+        if engine not in ENGINES:
+            raise ValueError(f"Scenario {number} has unknown engine '{engine}', pick from: {', '.join(ENGINES)}")
+        if engine not in engines:
+            engines[engine] = get_monopoly_cls(engine)
+        scenario = Scenario(RULES[rules_name], engines[engine], turns)
+        scenarios.setdefault(scenario.key, scenario)
+    return list(scenarios.values())
+
+"""
+Splits every scenario into games for `cpu_count` cores, like a single simulation
+would be, and returns the tasks to play them, the ones expected to take longest
+first. Starting with the long games keeps the workers from waiting on one long
+game at the end.
+"""
+def make_tasks(scenarios, cpu_count, min_game_turns=1000000):
+    tasks = []
+    for index, scenario in enumerate(scenarios):
+        turns = calculate_all_turns(scenario.turns, cpu_count, min_game_turns)
+        scenario.games = len(turns)
+        cost = 1/ENGINE_MOVES_PER_SEC[scenario.engine]
+        tasks.extend((game_turns*cost, index, game_turns) for game_turns in turns)
+    tasks.sort(key=lambda task: task[0], reverse=True)
+    return [(index, game_turns) for cost, index, game_turns in tasks]
+
+"""
+Yields the tasks with a new game for each, so the games are only made as the
+pool needs them.
+"""
+def generate_tasks(scenarios, tasks):
+    for index, game_turns in tasks:
+        scenario = scenarios[index]
+        yield index, scenario.monopoly_cls(scenario.rules), game_turns
+
+"""
+Plays the game of a task. Returns the index of its scenario with the
+`GameOutput`, so it can be matched up with its scenario when the tasks finish
+out of order.
+"""
+def play_task(task):
+    index, game, turns = task
+    return index, play_game(game, turns)
+
+"""
+Saves the results of a scenario once all of its games are done. They go in the
+`store` if there is one, otherwise in a directory named after the scenario's key
+inside `results_dir`, with its metrics and the scenario itself. The scenario is
+saved last, so a scenario only counts as done once everything else is saved.
+The run time of a scenario is its longest game.
+"""
+def save_scenario(scenario, results_dir, store, start):
+    output = combine_outputs(scenario.outputs)
+    result = Result(output.results, max(stats.duration for stats in output.worker_stats), scenario.games)
+    console.print(f"\n[bold]Done:[/] {scenario} in [cyan]{result.pretty_duration()}")
+    if store is not None:
+        store.add(scenario.info, result.results)
+        return
+    scenario_dir = results_dir / scenario.key
+    export_timer = Timer()
+    with export_timer:
+        save_results(result, scenario_dir)
+    save_metrics(collect_metrics(result, output.worker_stats, scenario.monopoly_cls, scenario.rules, start, export_timer.duration), scenario_dir)
+    (scenario_dir / SCENARIO_INFO).write_text(json.dumps(scenario.info, indent=4))
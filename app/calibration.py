@@ -0,0 +1,139 @@
+import os, json, math, platform, time
+from multiprocessing import Pool
+from pathlib import Path
+
+from .utils import init_worker, cache_dir
+
+CALIBRATION_SECONDS = 0.25 # how long to measure each number of workers for
+MIN_GAME_SECONDS = 0.05    # shortest a game should be, so its setup doesn't matter
+MIN_SPEEDUP = 1.05         # how much faster more workers need to be to use them
+CALIBRATION_VERSION = 1    # bump when the measurements change, to ignore old ones
+
+"""
+Returns how many CPUs the container's cgroup allows, or None if it isn't limited.
+Both cgroup v2 (cpu.max) and v1 (cpu.cfs_quota_us) are checked.
+"""
+def cgroup_cpu_limit():
+    try:
+        quota, period = Path("/sys/fs/cgroup/cpu.max").read_text().split()
+        if quota == "max":
+            return None
+        return max(1, math.ceil(int(quota)/int(period)))
+    except (OSError, ValueError):
+        pass
+    try:
+        quota = int(Path("/sys/fs/cgroup/cpu/cpu.cfs_quota_us").read_text())
+        period = int(Path("/sys/fs/cgroup/cpu/cpu.cfs_period_us").read_text())
+        if quota > 0 and period > 0:
+            return max(1, math.ceil(quota/period))
+    except (OSError, ValueError):
+        pass
+    return None
+
+"""
+Returns the number of CPUs this process can actually use. That's the CPUs it is
+allowed to run on, further limited by the cgroup CPU quota if there is one.
+"""
+def available_cpus():
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError: # not on Linux
+        cpus = os.cpu_count() or 1
+    limit = cgroup_cpu_limit()
+    return min(cpus, limit) if limit else cpus
+
+def calibration_path():
+    return cache_dir() / "calibration.json"
+
+"""
+Plays a game of `turns` turns and returns how long it took. Used as the task for
+the pool when calibrating.
+"""
+def timed_game(monopoly_cls, rules, turns):
+    game = monopoly_cls(rules)
+    start = time.perf_counter()
+    game.take_turns(turns)
+    return time.perf_counter() - start
+
+"""
+Measures the moves per second with each number of workers, up to `max_workers`,
+and how long it takes for a pool with that many workers to start. The first
+game is only there to warm up the engine (the Numba one compiles on first use),
+after that the number of turns is sized so each measurement takes about
+`CALIBRATION_SECONDS`.
+"""
+def calibrate(monopoly_cls, rules, max_workers):
+    timed_game(monopoly_cls, rules, 10000)
+    turns = 100000
+    duration = timed_game(monopoly_cls, rules, turns)
+    while duration < CALIBRATION_SECONDS/4:
+        turns *= 4
+        duration = timed_game(monopoly_cls, rules, turns)
+    turns = max(1, int(turns*CALIBRATION_SECONDS/duration))
+
+    worker_counts = {max_workers}
+    workers = 1
+    while workers < max_workers:
+        worker_counts.add(workers)
+        workers *= 2
+
+    measurements = {}
+    for workers in sorted(worker_counts):
+        start = time.perf_counter()
+        with Pool(workers, initializer=init_worker) as pool:
+            pool.starmap(timed_game, [(monopoly_cls, rules, 10000)]*workers, chunksize=1)
+            startup = time.perf_counter() - start
+            start = time.perf_counter()
+            pool.starmap(timed_game, [(monopoly_cls, rules, turns)]*workers, chunksize=1)
+            duration = time.perf_counter() - start
+        # A single game is played without a pool
+        measurements[workers] = {"moves_per_sec": workers*turns/duration, "startup": startup if workers > 1 else 0}
+    return measurements
+
+"""
+Returns the calibration for `monopoly_cls` on this host, only measuring it if it
+isn't in the cache yet (or `recalibrate` is set). The cache is keyed by the host
+name and then the engine and CPU count, since that is what the measurements
+depend on.
+"""
+def load_calibration(monopoly_cls, rules, max_workers, recalibrate=False):
+    path = calibration_path()
+    try:
+        cache = json.loads(path.read_text())
+        if cache.get("version") != CALIBRATION_VERSION:
+            cache = {}
+    except (OSError, ValueError):
+        cache = {}
+    host_cache = cache.setdefault("hosts", {}).setdefault(platform.node(), {})
+    key = f"{monopoly_cls.__module__}.{monopoly_cls.__name__}|{max_workers}"
+    if not recalibrate and key in host_cache:
+        return {int(workers): measurement for workers, measurement in host_cache[key].items()}
+
+    measurements = calibrate(monopoly_cls, rules, max_workers)
+    host_cache[key] = measurements
+    cache["version"] = CALIBRATION_VERSION
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(cache, indent=2))
+    except OSError:
+        pass # the calibration still gets used, it just won't be cached
+    return measurements
+
+"""
+Returns the number of workers to use and the fewest turns to put in a game for
+`total_turns`. The number of workers is the one that is expected to finish
+first, counting the time to start the pool, so small simulations don't start
+workers they won't make up for. More workers have to be expected to be at least
+`MIN_SPEEDUP` faster, so noise in the measurements doesn't pick them. Games are
+kept long enough that their setup doesn't matter.
+"""
+def plan_games(total_turns, measurements):
+    def expected_duration(workers):
+        measurement = measurements[workers]
+        return measurement["startup"] + total_turns/measurement["moves_per_sec"]
+    workers = min(measurements)
+    for more_workers in sorted(measurements):
+        if expected_duration(more_workers) < expected_duration(workers)/MIN_SPEEDUP:
+            workers = more_workers
+    min_game_turns = int(measurements[workers]["moves_per_sec"]/workers*MIN_GAME_SECONDS)
+    return workers, max(1, min_game_turns)
@@ -0,0 +1,107 @@
+import threading, queue
+from contextlib import contextmanager
+from multiprocessing.managers import SyncManager
+
+from .utils import load_board_spaces, make_results_dir, init_worker
+
+CONVERGENCE_START = 1000000 # first snapshot, after that one every time the moves double
+
+"""
+Returns the total number of moves to take a snapshot at, the last one always
+being the end of the simulation.
+"""
+def convergence_checkpoints(total_turns):
+    checkpoints = []
+    moves = CONVERGENCE_START
+    while moves < total_turns:
+        checkpoints.append(moves)
+        moves *= 2
+    checkpoints.append(total_turns)
+    return checkpoints
+
+"""
+Sends a game's results to the `ConvergenceLog` at each of its checkpoints. This is
+just the queue, which game it is and when to send, so it can be pickled and sent
+to another process along with the game.
+"""
+class SnapshotSender(object):
+    def __init__(self, queue, game_index, checkpoints):
+        self.queue = queue
+        self.game_index = game_index
+        self.checkpoints = checkpoints
+
+    def send(self, checkpoint_index, results):
+        self.queue.put((self.game_index, checkpoint_index, list(results)))
+
+"""
+Collects the snapshots the games send while they play and writes the combined
+probabilities to a csv file. The games only ever hand off their results list,
+all of the adding up and writing happens on a thread in the main process. A row
+is written as soon as every game has reached that checkpoint.
+"""
+class ConvergenceLog(object):
+    def __init__(self, queue, turns, results_dir=None):
+        self.queue = queue
+        self.turns = turns
+        self.path = make_results_dir(results_dir) / 'board-probabilities-convergence.csv'
+        self.board_spaces = load_board_spaces()
+        self.checkpoints = convergence_checkpoints(sum(turns))
+        self.pending = [{} for checkpoint in self.checkpoints]
+        self.next_row = 0
+        self.thread = None
+
+    """
+    Returns a `SnapshotSender` for each game. The checkpoints of each game are
+    its share of the total checkpoints.
+    """
+    def senders(self):
+        total_turns = sum(self.turns)
+        return [SnapshotSender(self.queue, game_index, [checkpoint*game_turns//total_turns for checkpoint in self.checkpoints])
+                for game_index, game_turns in enumerate(self.turns)]
+
+    def __enter__(self):
+        self.thread = threading.Thread(target=self._write_rows, daemon=True)
+        self.thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, traceback):
+        self.queue.put(None)
+        self.thread.join()
+        return False
+
+    def _write_rows(self):
+        with self.path.open('w') as fconvergence:
+            fconvergence.write(",".join(["Moves"] + [board_space.name for board_space in self.board_spaces]) + "\n")
+            fconvergence.flush()
+            for snapshot in iter(self.queue.get, None):
+                game_index, checkpoint_index, results = snapshot
+                self.pending[checkpoint_index][game_index] = results
+                while self.next_row < len(self.checkpoints) and len(self.pending[self.next_row]) == len(self.turns):
+                    results = [sum(square) for square in zip(*self.pending[self.next_row].values())]
+                    self.pending[self.next_row] = None
+                    self.next_row += 1
+                    total_turns = sum(results)
+                    if total_turns == 0:
+                        continue
+                    fconvergence.write(",".join([str(total_turns)] + [f"{result/total_turns:.5%}" for result in results]) + "\n")
+                    fconvergence.flush()
+
+"""
+Context manager that runs a `ConvergenceLog` for the games in `turns` and yields
+the snapshot senders to pass to `generate_games`. When the games are played in
+parallel the snapshots are sent through a queue from a manager process, since
+those can be pickled and sent to the pool's worker processes.
+"""
+@contextmanager
+def convergence_log(turns, results_dir=None, parallel=False):
+    if parallel:
+        manager = SyncManager()
+        manager.start(init_worker)
+        try:
+            with ConvergenceLog(manager.Queue(), turns, results_dir) as log:
+                yield log.senders()
+        finally:
+            manager.shutdown()
+    else:
+        with ConvergenceLog(queue.Queue(), turns, results_dir) as log:
+            yield log.senders()
@@ -1 +1,28 @@
-from .monopoly import Monopoly
+import sys
+from importlib import import_module
+
+from .cpu import supported_variants
+
+"""
+setup.py can build the extension more than once, each build optimized for a
+different level of CPU (see `cpu.VARIANTS`). Import the best one this CPU can
+run, falling back to the generic build.
+"""
+for VARIANT in supported_variants():
+    try:
+        monopoly = import_module(f".{VARIANT}.monopoly", __name__)
+        break
+    except ImportError:
+        pass
+else:
+    VARIANT = "generic"
+    from . import monopoly
+
+# Every variant is compiled from the same source, so they all think they are
+# 'app.cython_ext.monopoly'. That is the name pickle uses to find the class when
+# sending games to other processes, so make sure it finds the variant in use.
+sys.modules[f"{__name__}.monopoly"] = monopoly
+
+Monopoly = monopoly.Monopoly
+LaneMonopoly = monopoly.LaneMonopoly
+LANES = monopoly.LANES
@@ -0,0 +1,69 @@
+import os, sys, platform, subprocess
+
+# This module is also loaded by setup.py (straight from its file, before the
+# app package can be imported), so it should only use the standard library.
+
+"""
+The CPU features that code compiled with `-march=x86-64-v3` can use, named the
+way they are listed in /proc/cpuinfo ('abm' is how Linux lists LZCNT).
+"""
+X86_64_V3_FLAGS = {"avx", "avx2", "bmi1", "bmi2", "f16c", "fma", "abm", "movbe"}
+
+# macOS lists the same features with different names
+MACOS_FLAG_NAMES = {"avx1.0": "avx", "lzcnt": "abm"}
+
+# From winnt.h
+PF_AVX2_INSTRUCTIONS_AVAILABLE = 40
+
+def is_x86_64():
+    return platform.machine().lower() in ("x86_64", "amd64")
+
+def cpu_flags():
+    if sys.platform.startswith("linux"):
+        try:
+            with open("/proc/cpuinfo") as fp_cpuinfo:
+                for line in fp_cpuinfo:
+                    if line.startswith("flags"):
+                        return set(line.split(":", 1)[1].split())
+        except OSError:
+            pass
+    elif sys.platform == "darwin":
+        try:
+            features = subprocess.run(
+                ["sysctl", "-n", "machdep.cpu.features", "machdep.cpu.leaf7_features", "machdep.cpu.extfeatures"],
+                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
+            ).stdout.lower().split()
+            return {MACOS_FLAG_NAMES.get(feature, feature) for feature in features}
+        except OSError:
+            pass
+    return set()
+
+def supports_x86_64_v3():
+    if not is_x86_64():
+        return False
+    if os.name == "nt":
+        # Windows can only tell us about AVX2, but every CPU with AVX2 has the
+        # rest of the x86-64-v3 features too.
+        import ctypes
+        return bool(ctypes.windll.kernel32.IsProcessorFeaturePresent(PF_AVX2_INSTRUCTIONS_AVAILABLE))
+    return X86_64_V3_FLAGS <= cpu_flags()
+
+"""
+The optimized variants of the extension, from most to least preferred, each with
+the function that checks if this CPU can run it. The generic build is always the
+last resort and isn't listed here.
+"""
+VARIANTS = [
+    ("x86_64_v3", supports_x86_64_v3),
+]
+
+"""
+Returns the names of the variants this CPU can run, best first. Set the
+MONOPOLY_EXTENSION_VARIANT environment variable to force a single variant
+('generic' for none of them).
+"""
+def supported_variants():
+    forced = os.getenv("MONOPOLY_EXTENSION_VARIANT")
+    if forced:
+        return [name for name, supported in VARIANTS if name == forced]
+    return [name for name, supported in VARIANTS if supported()]
@@ -3,19 +3,50 @@
 
 from libcpp.set cimport set
 
-from random import random
+from libc.stdint cimport uint32_t, uint64_t
+
+from random import getrandbits
 
 from cpython.exc cimport PyErr_CheckSignals
 
+from app.monopoly import random_rolls, random_bytes, BYTE_BLOCK_SIZE
+from app.rules import STANDARD_RULES
+
 cdef enum:
     JAIL = 40
+    NUM_SQUARES = 41
+    VISIT_GAP_BUCKETS = 128 # these two need to match app/monopoly.py
+    JAIL_STAY_BUCKETS = 16
+    TRACE_CARD = 0x40 # the trace format also needs to match app/monopoly.py
+    TRACE_DOUBLES = 0x80
+    TRACE_BUFFER_SIZE = 1 << 20
+    NUM_LANES = 8 # games played side by side by LaneMonopoly
+    MAX_CARDS = 16
+    LANE_CHECK_INTERVAL = 1 << 16 # turns per lane between checking for signals
+
+# Card codes for LaneMonopoly, cards that send you to a square are the square
+cdef enum:
+    CARD_NONE = -1
+    CARD_UTILITY = -2
+    CARD_RAILROAD = -3
+    CARD_BACK = -4
+
+# Square kinds for LaneMonopoly
+cdef enum:
+    SQUARE_PLAIN = 0
+    SQUARE_COMMUNITY = 1
+    SQUARE_CHANCE = 2
+    SQUARE_GO_TO_JAIL = 3
+
+LANES = NUM_LANES
 
 cdef class Monopoly():
     cdef int num_spaces
-    cdef set[int] community_squares # this is correct, but differs from maths.py  # THIS IS WHERE THE DESCREPANCY
-    cdef set[int] chance_squares # this is correct, but differs from maths.py     # IN PROBABILITIES COMES FROM
-    cdef list community_cards # Two cards change your position, the rest don't matter
-    cdef list chance_cards # 9 cards change your position
+    cdef set[int] community_squares
+    cdef set[int] chance_squares
+    cdef list community_cards
+    cdef list chance_cards
+    cdef bint reset_doubles
     cdef int[36] roll_values # all possible combos of dice rolls
     cdef set[int] double_indices # more efficient than rolling dice twice
     cdef list community_deck
@@ -24,13 +55,29 @@ cdef class Monopoly():
     cdef long long total_turns
     cdef int current_position
     cdef int doubles
+    cdef readonly bint track_visits
+    cdef long long[NUM_SQUARES] last_visit
+    cdef readonly long long[NUM_SQUARES*VISIT_GAP_BUCKETS] visit_gaps # flattened, one row of buckets per square
+    cdef readonly long long[JAIL_STAY_BUCKETS] jail_stays
+    cdef long long jail_stay
+    cdef object trace_path
+    cdef bytearray trace_buffer
+    cdef Py_ssize_t trace_length
+    cdef bint rolled_doubles
+    cdef bint card_moved
+    cdef bytes rolls # blocks of random numbers, see RandomBlocks in app/monopoly.py
+    cdef Py_ssize_t roll_cursor
+    cdef bytes random_block
+    cdef Py_ssize_t byte_cursor
 
-    def __init__(self):
+    def __init__(self, rules=None, track_visits=False, trace_path=None):
+        rules = rules or STANDARD_RULES
         self.num_spaces = 40
-        self.community_squares = {2,17,33}
-        self.chance_squares = {7,22,36}
-        self.community_cards = [0,JAIL] + [None for i in range(14)]
-        self.chance_cards = [0,5,11,24,39,'U','R','B',JAIL] + [None for i in range(7)]
+        self.community_squares = rules.community_squares
+        self.chance_squares = rules.chance_squares
+        self.community_cards = list(rules.community_cards)
+        self.chance_cards = list(rules.chance_cards)
+        self.reset_doubles = rules.reset_doubles
         self.roll_values = [2,3,4,5,6,7,3,4,5,6,7,8,4,5,6,7,8,9,5,6,7,8,9,10,6,7,8,9,10,11,7,8,9,10,11,12]
         self.double_indices = {0,7,14,21,28,35}
 
@@ -40,31 +87,54 @@ cdef class Monopoly():
         self.total_turns = 0
         self.current_position = 0
         self.doubles = 0
+        self.track_visits = track_visits
+        self.last_visit = [-1 for i in range(NUM_SQUARES)]
+        self.visit_gaps = [0 for i in range(NUM_SQUARES*VISIT_GAP_BUCKETS)]
+        self.jail_stays = [0 for i in range(JAIL_STAY_BUCKETS)]
+        self.jail_stay = 0
+        self.trace_path = trace_path
+        self.trace_buffer = bytearray(TRACE_BUFFER_SIZE) if trace_path is not None else None
+        self.trace_length = 0
+        self.rolled_doubles = False
+        self.card_moved = False
+        self.rolls = b''
+        self.roll_cursor = 0
+        self.random_block = b''
+        self.byte_cursor = 0
 
     cpdef take_turns(self, long long turns):
         while self.total_turns < turns:
             spaces = self.roll_dice()
-            if self.doubles == 3:
+            if self.doubles >= 3:
                 self.move_to(JAIL)
-                self.doubles = 0 # reset after 3 doubles (differs from maths.py)
+                if self.reset_doubles:
+                    self.doubles = 0 # reset after 3 doubles (differs from maths.py)
             else:
                 self.move_spaces(spaces)
-                if self.current_position == 30: # Go to Jail
-                    self.move_to(JAIL)
-                elif self.community_squares.count(self.current_position) == 1:
+                if self.community_squares.count(self.current_position) == 1:
                     self.draw_community_chest()
                 elif self.chance_squares.count(self.current_position) == 1:
                     self.draw_chance()
+                if self.current_position == 30: # Go to Jail (checked after cards, 'B' can land here with maths.py rules)
+                    self.move_to(JAIL)
             self.end_turn()
+        if self.trace_path is not None:
+            self.flush_trace()
 
     cdef int roll_dice(self):
-        # cdef int roll_index = randrange(36) # This seems to take a little longer
-        cdef int roll_index = int(random()*36)
-        # cdef int roll_index = rand()%36
+        cdef const unsigned char *rolls
+        if self.roll_cursor == len(self.rolls):
+            self.rolls = random_rolls()
+            self.roll_cursor = 0
+        rolls = self.rolls
+        cdef int roll_index = rolls[self.roll_cursor]
+        self.roll_cursor += 1
         if self.double_indices.count(roll_index) == 1:
             self.doubles+=1
+            self.rolled_doubles = True
         else:
             self.doubles = 0
+            self.rolled_doubles = False
         return self.roll_values[roll_index]
 
     cdef move_spaces(self, int spaces):
@@ -79,12 +149,47 @@ cdef class Monopoly():
 
     cdef end_turn(self):
         self.results[self.current_position]+=1
+        if self.track_visits:
+            self.record_visit()
+        if self.trace_path is not None:
+            self.record_trace()
         self.total_turns+=1
         if self.total_turns % 100000 == 0:
             PyErr_CheckSignals()
             with nogil:
                 pass
 
+    cdef record_visit(self):
+        cdef int position = self.current_position
+        cdef long long last_visit = self.last_visit[position]
+        cdef long long gap
+        if last_visit >= 0:
+            gap = min(self.total_turns - last_visit, <long long>VISIT_GAP_BUCKETS)
+            self.visit_gaps[position*VISIT_GAP_BUCKETS + gap-1]+=1
+        self.last_visit[position] = self.total_turns
+        if position == JAIL:
+            self.jail_stay+=1
+        elif self.jail_stay > 0:
+            self.jail_stays[min(self.jail_stay, <long long>JAIL_STAY_BUCKETS)-1]+=1
+            self.jail_stay = 0
+
+    cdef record_trace(self):
+        cdef unsigned char record = self.current_position
+        if self.card_moved:
+            record |= TRACE_CARD
+            self.card_moved = False
+        if self.rolled_doubles:
+            record |= TRACE_DOUBLES
+        self.trace_buffer[self.trace_length] = record
+        self.trace_length+=1
+        if self.trace_length == TRACE_BUFFER_SIZE:
+            self.flush_trace()
+
+    cdef flush_trace(self):
+        with open(self.trace_path, 'ab') as ftrace:
+            ftrace.write(memoryview(self.trace_buffer)[:self.trace_length])
+        self.trace_length = 0
+
     cdef move_to_utility(self):
         if self.current_position > 12 and self.current_position < 28:
             self.move_to(28)
@@ -103,6 +208,7 @@ cdef class Monopoly():
             self.community_deck = self.shuffle_deck(self.community_cards)
         card = self.community_deck.pop()
         if card is not None:
+            self.card_moved = True
             self.move_to(card)
 
     cdef draw_chance(self):
@@ -110,6 +216,8 @@ cdef class Monopoly():
             # self.chance_deck = random.sample(self.chance_cards, len(self.chance_cards))
             self.chance_deck = self.shuffle_deck(self.chance_cards)
         card = self.chance_deck.pop()
+        if card is not None:
+            self.card_moved = True
         if card == 'U':
             self.move_to_utility()
         elif card == 'R':
@@ -119,14 +227,200 @@ cdef class Monopoly():
         elif card is not None:
             self.move_to(card)
 
+    # A random number from 0 to n-1 for n up to 256, skipping the bytes that would make the lower ones more likely
+    cdef int random_below(self, int n):
+        cdef const unsigned char *block
+        cdef int value
+        cdef int limit = 256 - 256 % n
+        while True:
+            if self.byte_cursor == len(self.random_block):
+                self.random_block = random_bytes(BYTE_BLOCK_SIZE)
+                self.byte_cursor = 0
+            block = self.random_block
+            value = block[self.byte_cursor]
+            self.byte_cursor += 1
+            if value < limit:
+                return value % n
+
     cdef list shuffle_deck(self, list deck):
         cdef list shuffled = deck.copy()
         cdef int i,r
         cdef move
         cdef int n = len(shuffled)
         for i in range(n-1,0,-1):
-            r = int(random()*i)
+            r = self.random_below(i+1)
             move = shuffled[r]
             shuffled[r] = shuffled[i]
             shuffled[i] = move
         return shuffled
+
+cdef int card_code(card) except? -5:
+    if card is None:
+        return CARD_NONE
+    elif card == 'U':
+        return CARD_UTILITY
+    elif card == 'R':
+        return CARD_RAILROAD
+    elif card == 'B':
+        return CARD_BACK
+    return card
+
+cdef inline uint64_t next_random(uint64_t *state) nogil:
+    # splitmix64
+    state[0] += 0x9e3779b97f4a7c15ULL
+    cdef uint64_t z = state[0]
+    z = (z ^ (z >> 30)) * 0xbf58476d1ce4e5b9ULL
+    z = (z ^ (z >> 27)) * 0x94d049bb133111ebULL
+    return z ^ (z >> 31)
+
+# Multiplies the top 32 bits by n and keeps the top of the product (Lemire's method),
+# drawing again for the few values that would make some results more likely
+cdef inline int random_below(uint64_t *state, int n) nogil:
+    cdef uint64_t product = (next_random(state) >> 32) * <uint64_t>n
+    cdef uint32_t threshold
+    if <uint32_t>product < <uint32_t>n:
+        threshold = (<uint32_t>-n) % <uint32_t>n # 2**32 % n
+        while <uint32_t>product < threshold:
+            product = (next_random(state) >> 32) * <uint64_t>n
+    return <int>(product >> 32)
+
+"""
+Plays `NUM_LANES` games side by side. Each turn of one game depends on the turn
+before it, so the single game in `Monopoly` keeps the CPU waiting on the last
+position. Here each pass of the inner loop takes a turn in every lane, and the
+lanes don't depend on each other, so their turns can overlap. All of the state is
+kept in C arrays and the dice and shuffles use a small C random number generator
+(seeded from `random`), so the loop runs without the GIL.
+
+The results are the lanes combined, and `take_turns` counts the turns of all of
+the lanes, so it is used just like `Monopoly`. It doesn't record visit stats or
+traces.
+"""
+cdef class LaneMonopoly():
+    cdef int[36] roll_values
+    cdef bint[36] double_rolls
+    cdef int[40] square_kinds
+    cdef int[MAX_CARDS] community_cards
+    cdef int[MAX_CARDS] chance_cards
+    cdef int num_community_cards
+    cdef int num_chance_cards
+    cdef bint reset_doubles
+    cdef long long total_turns
+    cdef int[NUM_LANES] positions
+    cdef int[NUM_LANES] doubles
+    cdef uint64_t[NUM_LANES] random_states
+    cdef int[NUM_LANES*MAX_CARDS] community_decks
+    cdef int[NUM_LANES*MAX_CARDS] chance_decks
+    cdef int[NUM_LANES] community_left
+    cdef int[NUM_LANES] chance_left
+    cdef long long[NUM_LANES*NUM_SQUARES] lane_results
+    cdef readonly bint track_visits # always False, just so it can be used like Monopoly
+
+    def __init__(self, rules=None, track_visits=False, trace_path=None):
+        if track_visits or trace_path is not None:
+            raise ValueError("LaneMonopoly can't record visit stats or traces")
+        rules = rules or STANDARD_RULES
+        if len(rules.community_cards) > MAX_CARDS or len(rules.chance_cards) > MAX_CARDS:
+            raise ValueError(f"LaneMonopoly supports decks of up to {MAX_CARDS} cards")
+        cdef int i
+        self.roll_values = [2,3,4,5,6,7,3,4,5,6,7,8,4,5,6,7,8,9,5,6,7,8,9,10,6,7,8,9,10,11,7,8,9,10,11,12]
+        for i in range(36):
+            self.double_rolls[i] = i in (0,7,14,21,28,35)
+        for i in range(40):
+            if i in rules.community_squares:
+                self.square_kinds[i] = SQUARE_COMMUNITY
+            elif i in rules.chance_squares:
+                self.square_kinds[i] = SQUARE_CHANCE
+            elif i == 30:
+                self.square_kinds[i] = SQUARE_GO_TO_JAIL
+            else:
+                self.square_kinds[i] = SQUARE_PLAIN
+        self.num_community_cards = len(rules.community_cards)
+        self.num_chance_cards = len(rules.chance_cards)
+        for i in range(self.num_community_cards):
+            self.community_cards[i] = card_code(rules.community_cards[i])
+        for i in range(self.num_chance_cards):
+            self.chance_cards[i] = card_code(rules.chance_cards[i])
+        self.reset_doubles = rules.reset_doubles
+
+        self.total_turns = 0
+        for i in range(NUM_LANES):
+            self.positions[i] = 0
+            self.doubles[i] = 0
+            self.random_states[i] = getrandbits(64)
+            self.community_left[i] = 0
+            self.chance_left[i] = 0
+        for i in range(NUM_LANES*NUM_SQUARES):
+            self.lane_results[i] = 0
+
+    @property
+    def results(self):
+        return [sum(self.lane_results[lane*NUM_SQUARES + square] for lane in range(NUM_LANES)) for square in range(NUM_SQUARES)]
+
+    cpdef take_turns(self, long long turns):
+        cdef long long rounds
+        while self.total_turns < turns:
+            rounds = min((turns - self.total_turns) // NUM_LANES, <long long>LANE_CHECK_INTERVAL)
+            if rounds == 0:
+                # Fewer turns left than lanes, finish with some of them
+                self.take_round(turns - self.total_turns)
+                self.total_turns = turns
+                break
+            with nogil:
+                while rounds > 0:
+                    self.take_round(NUM_LANES)
+                    rounds-=1
+                    self.total_turns+=NUM_LANES
+            PyErr_CheckSignals()
+
+    cdef void take_round(self, int lanes) nogil:
+        cdef int lane, roll_index, position, doubles, kind
+        for lane in range(lanes):
+            roll_index = random_below(&self.random_states[lane], 36)
+            position = self.positions[lane]
+            doubles = self.doubles[lane]+1 if self.double_rolls[roll_index] else 0
+            if doubles >= 3:
+                position = JAIL
+                if self.reset_doubles:
+                    doubles = 0
+            else:
+                if position == JAIL:
+                    position = 10
+                position += self.roll_values[roll_index]
+                if position >= 40:
+                    position -= 40
+                kind = self.square_kinds[position]
+                if kind == SQUARE_COMMUNITY:
+                    position = self.draw_card(lane, position, self.community_decks, self.community_left, self.community_cards, self.num_community_cards)
+                elif kind == SQUARE_CHANCE:
+                    position = self.draw_card(lane, position, self.chance_decks, self.chance_left, self.chance_cards, self.num_chance_cards)
+                if position == 30:
+                    position = JAIL
+            self.positions[lane] = position
+            self.doubles[lane] = doubles
+            self.lane_results[lane*NUM_SQUARES + position]+=1
+
+    cdef int draw_card(self, int lane, int position, int *decks, int *left, int *cards, int num_cards) nogil:
+        cdef int *deck = &decks[lane*MAX_CARDS]
+        cdef int i, r, card
+        if left[lane] == 0:
+            for i in range(num_cards):
+                deck[i] = cards[i]
+            for i in range(num_cards-1, 0, -1):
+                r = random_below(&self.random_states[lane], i+1)
+                card = deck[r]
+                deck[r] = deck[i]
+                deck[i] = card
+            left[lane] = num_cards
+        left[lane]-=1
+        card = deck[left[lane]]
+        if card == CARD_NONE:
+            return position
+        elif card == CARD_UTILITY:
+            return 28 if position > 12 and position < 28 else 12
+        elif card == CARD_RAILROAD:
+            position += (10 - (position+5)%10)%10
+            return position - 40 if position >= 40 else position
+        elif card == CARD_BACK:
+            return position - 3
+        return card
@@ -0,0 +1,288 @@
+"""
+Checks that every engine plays the same game. Each engine is run with a fixed
+seed and its results are compared to the exact probabilities from
+`ExtendedModel` and to the results of the original pure Python `Monopoly`
+class, with chi-squared and Kolmogorov-Smirnov tests. The model keeps track of
+what is left in the decks like the engines do, `TransitionModel` draws every card
+from the full deck, which is far enough off to fail with enough turns.
+
+It also checks that the tests would notice if an engine got the rules wrong:
+the results have to be rejected when compared to the probabilities of rules
+with a change to them. Those only need to be different enough, so they come
+from `TransitionModel`, which is quick to solve. A change is only checked when
+there are enough turns to be nearly sure of rejecting it.
+
+Run with:
+
+python -m app.equivalence
+
+or `scriptopoly verify`. It exits with an error if any check fails.
+"""
+
+import argparse, json, math, random, sys
+
+from .extended import ExtendedModel
+from .markov import TransitionModel
+from .monopoly import Monopoly as PyMonopoly, FastMonopoly
+from .rules import RULES
+from .store import make_scenario, scenario_key
+from .utils import console, cache_dir, load_numba_monopoly, CMonopoly, LaneMonopoly
+
+P_VALUE_THRESHOLD = 1e-4 # a check fails when its results are less likely than this
+KS_COEFFICIENT = math.sqrt(-math.log(P_VALUE_THRESHOLD/2)/2) # the matching KS critical value
+REJECT_SDS = 3.7 # how sure a broken rules check needs to be of rejecting, in standard deviations (about 1 in 10,000 to miss)
+MODEL_CACHE_VERSION = 1 # bump when ExtendedModel changes, to solve it again
+
+"""
+Returns the engines that are available, as (name, Monopoly class) tuples.
+"""
+def available_engines():
+    engines = [("python", PyMonopoly), ("python-fast", FastMonopoly)]
+    if CMonopoly is not None:
+        engines += [("cython", CMonopoly), ("lanes", LaneMonopoly)]
+    NumbaMonopoly = load_numba_monopoly()
+    if NumbaMonopoly is not None:
+        engines.append(("numba", NumbaMonopoly))
+    return engines
+
+"""
+The rules with one thing changed, for checking that the tests notice when an
+engine gets it wrong.
+"""
+def broken_rules(rules):
+    return [
+        ("doubles reset flipped", rules._replace(reset_doubles=not rules.reset_doubles)),
+        ("'B' card ignored", rules._replace(chance_cards=tuple(None if card == 'B' else card for card in rules.chance_cards))),
+    ]
+
+def approximate_probabilities(rules, tolerance=1e-13):
+    model = TransitionModel(rules)
+    vector = model.start_vector()
+    change = 1
+    while change > tolerance:
+        next_vector = model.step(vector)
+        change = sum(abs(a - b) for a, b in zip(next_vector, vector))
+        vector = next_vector
+    return model.square_probabilities(vector)
+
+def model_cache_path():
+    return cache_dir() / "extended-probabilities.json"
+
+"""
+Returns the probability of ending a turn on each square with `rules`, from
+`ExtendedModel` with both decks tracked. Solving it takes minutes, so the
+probabilities are cached, keyed by the rules.
+"""
+def stationary_probabilities(rules):
+    path = model_cache_path()
+    try:
+        cache = json.loads(path.read_text())
+        if cache.get("version") != MODEL_CACHE_VERSION:
+            cache = {}
+    except (OSError, ValueError):
+        cache = {}
+    solved = cache.setdefault("probabilities", {})
+    key = scenario_key(make_scenario(rules, "extended"))
+    if key not in solved:
+        model = ExtendedModel(rules)
+        with console.status(f"Solving the model for the {rules.name} rules (only the first time)"):
+            vector, iterations, change = model.stationary()
+        solved[key] = model.square_probabilities(vector)
+        cache["version"] = MODEL_CACHE_VERSION
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(cache))
+        except OSError:
+            pass # the probabilities still get used, they just won't be cached
+    return solved[key]
+
+def play(monopoly_cls, rules, turns, seed):
+    random.seed(seed)
+    game = monopoly_cls(rules)
+    game.take_turns(turns)
+    return list(game.results)
+
+"""
+Returns the chance of a chi-squared statistic at least as big as `statistic`
+with `dof` degrees of freedom (the regularized upper incomplete gamma function).
+"""
+def chi2_p_value(statistic, dof):
+    a, x = dof/2, statistic/2
+    if x <= 0:
+        return 1.0
+    log_prefix = a*math.log(x) - x - math.lgamma(a)
+    if x < a+1: # series
+        term = total = 1/a
+        n = a
+        while abs(term) > abs(total)*1e-15:
+            n += 1
+            term *= x/n
+            total += term
+        return max(0.0, 1 - math.exp(log_prefix)*total)
+    # continued fraction (modified Lentz)
+    tiny = 1e-300
+    b = x + 1 - a
+    c = 1/tiny
+    d = 1/b
+    h = d
+    i = 1
+    while True:
+        an = -i*(i - a)
+        b += 2
+        d = an*d + b
+        d = tiny if abs(d) < tiny else d
+        c = b + an/c
+        c = tiny if abs(c) < tiny else c
+        d = 1/d
+        delta = d*c
+        h *= delta
+        i += 1
+        if abs(delta - 1) < 1e-15:
+            break
+    return math.exp(log_prefix)*h
+
+"""
+Returns the chi-squared statistic with `dof` degrees of freedom that has a
+p-value of `p_value`.
+"""
+def chi2_critical_value(dof, p_value=P_VALUE_THRESHOLD):
+    low, high = 0.0, dof + 1.0
+    while chi2_p_value(high, dof) >= p_value:
+        high *= 2
+    for i in range(100):
+        middle = (low + high)/2
+        if chi2_p_value(middle, dof) >= p_value:
+            low = middle
+        else:
+            high = middle
+    return high
+
+"""
+Returns about how many turns results with the `probabilities` need to be
+rejected by the chi-squared test against `other_probabilities`, nearly every
+time. The statistic then has a noncentral chi-squared distribution with
+noncentrality λ = turns*Σ(p - q)²/q, and mean dof + λ and variance 2(dof + 2λ).
+Treating that as a normal distribution, λ is solved for to put the critical value
+`REJECT_SDS` standard deviations below the mean. A square that can't be landed on
+with `other_probabilities` only needs to be landed on once.
+"""
+def turns_to_reject(probabilities, other_probabilities):
+    noncentrality = 0
+    dof = -1
+    impossible = 0
+    for probability, other_probability in zip(probabilities, other_probabilities):
+        if other_probability == 0:
+            impossible += probability
+            continue
+        noncentrality += (probability - other_probability)**2/other_probability
+        dof += 1
+    turns = math.inf
+    if impossible:
+        turns = REJECT_SDS**2/impossible # the chance of never landing on them is then tiny
+    if noncentrality:
+        critical = chi2_critical_value(dof)
+        sd = 2*REJECT_SDS + math.sqrt(4*REJECT_SDS**2 + 4*critical - 2*dof) # sqrt(2(dof + 2λ))
+        turns = min(turns, (sd**2 - 2*dof)/4/noncentrality)
+    return math.ceil(turns)
+
+"""
+Compares the counts in `results` to the `probabilities` they should have.
+Returns the chi-squared p-value and the KS statistic divided by its critical
+value (so anything over 1 fails). A square that can't be landed on but was fails
+right away.
+"""
+def compare_to_probabilities(results, probabilities):
+    total = sum(results)
+    statistic = 0
+    dof = -1
+    for count, probability in zip(results, probabilities):
+        if probability == 0:
+            if count:
+                return 0.0, math.inf
+            continue
+        expected = total*probability
+        statistic += (count - expected)**2/expected
+        dof += 1
+    distance = max_cdf_distance([count/total for count in results], probabilities)
+    return chi2_p_value(statistic, dof), distance/(KS_COEFFICIENT/math.sqrt(total))
+
+"""
+Compares two sets of counts to each other. Returns the same values as
+`compare_to_probabilities`.
+"""
+def compare_results(results, other_results):
+    total, other_total = sum(results), sum(other_results)
+    scale, other_scale = math.sqrt(other_total/total), math.sqrt(total/other_total)
+    statistic = 0
+    dof = -1
+    for count, other_count in zip(results, other_results):
+        if count + other_count:
+            statistic += (scale*count - other_scale*other_count)**2/(count + other_count)
+            dof += 1
+    distance = max_cdf_distance([count/total for count in results], [count/other_total for count in other_results])
+    return chi2_p_value(statistic, dof), distance/(KS_COEFFICIENT*math.sqrt((total + other_total)/(total*other_total)))
+
+def max_cdf_distance(probabilities, other_probabilities):
+    distance = cdf = other_cdf = 0
+    for probability, other_probability in zip(probabilities, other_probabilities):
+        cdf += probability
+        other_cdf += other_probability
+        distance = max(distance, abs(cdf - other_cdf))
+    return distance
+
+class Checks(object):
+    def __init__(self):
+        self.failures = 0
+
+    """
+    Prints the outcome of a check. Checks against broken rules (`expect_pass`
+    False) pass when the results are rejected.
+    """
+    def report(self, name, p_value, ks_ratio, expect_pass=True):
+        passed = p_value >= P_VALUE_THRESHOLD and ks_ratio <= 1
+        if passed != expect_pass:
+            self.failures += 1
+            status = "[bold red]FAIL    [/]"
+        else:
+            status = "[green]ok      [/]" if passed else "[green]rejected[/]"
+        console.print(f" {status} {name:<44} p={p_value:<8.2g} KS={ks_ratio:.2f}")
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m app.equivalence", description="Check that every engine plays the same game.")
+    parser.add_argument("--turns", help="The number of turns each engine plays for each set of rules. (Default: 10,000,000)", type=int, default=10000000)
+    parser.add_argument("--seed", help="The seed for the random number generator. (Default: 2022)", type=int, default=2022)
+    flags = parser.parse_args()
+
+    checks = Checks()
+    engines = available_engines()
+    console.print(f"Engines: [cyan]{', '.join(name for name, monopoly_cls in engines)}[/]")
+    for rules in RULES.values():
+        console.rule(f"[bold]{rules.name.capitalize()} rules")
+        probabilities = stationary_probabilities(rules)
+        broken_probabilities = []
+        for change, changed_rules in broken_rules(rules):
+            changed_probabilities = approximate_probabilities(changed_rules)
+            turns = turns_to_reject(probabilities, changed_probabilities)
+            if flags.turns < turns:
+                console.print(f"-- Skipping '{change}', rejecting it needs about {turns:,} turns --", style="yellow")
+            else:
+                broken_probabilities.append((change, changed_probabilities))
+        reference_results = None
+        for name, monopoly_cls in engines:
+            results = play(monopoly_cls, rules, flags.turns, flags.seed)
+            checks.report(f"{name} vs exact", *compare_to_probabilities(results, probabilities))
+            if reference_results is None:
+                reference_results = results
+            else:
+                checks.report(f"{name} vs python", *compare_results(results, reference_results))
+            for change, changed_probabilities in broken_probabilities:
+                checks.report(f"{name} vs {change}", *compare_to_probabilities(results, changed_probabilities), expect_pass=False)
+
+    print()
+    if checks.failures:
+        console.print(f"{checks.failures} check{'s' if checks.failures != 1 else ''} failed", style="bold red")
+        sys.exit(1)
+    console.print("All checks passed", style="bold green")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,314 @@
+"""
+Exact probabilities for rules that make the state space too big for
+`TransitionModel`. The extended chain can also keep track of:
+
+    - What is left in the Community Chest and Chance decks. `TransitionModel`
+      draws each card from the full deck, but the engines go through the whole
+      shuffled deck before reshuffling.
+    - Staying in jail to try to roll doubles for up to `jail_turns` turns,
+      instead of leaving on the next turn like the engines do.
+
+With both decks that is tens of millions of states, so the transition matrix is
+never built. Each step works out where the probabilities go on the fly and the
+stationary distribution is found with power iteration. Run with:
+
+python -m app.extended --help
+"""
+
+import argparse, math, time
+
+import numpy as np
+
+from .markov import TransitionModel
+from .monopoly import Monopoly, JAIL
+from .rules import RULES
+from .utils import console, load_board_spaces, make_results_dir, pretty_duration, pluralize
+
+"""
+A deck as a Markov chain of its own. Which order the cards are in doesn't matter,
+only how many of each kind of card are left, since after a fair shuffle the next
+card is equally likely to be any of them. Each state is those counts packed into
+one index. Drawing the last card goes straight to the full deck, because it is
+reshuffled before the next draw, so the empty deck never has any probability.
+"""
+class DeckModel(object):
+    def __init__(self, cards):
+        self.kinds = list(dict.fromkeys(cards))
+        self.counts = [cards.count(kind) for kind in self.kinds]
+        self.size = len(cards)
+        self.strides = [math.prod(count+1 for count in self.counts[:kind]) for kind in range(len(self.kinds))]
+        self.num_states = math.prod(count+1 for count in self.counts)
+        self.full_state = sum(count*stride for count, stride in zip(self.counts, self.strides))
+        states = np.arange(self.num_states)
+        self.remaining = np.stack([states // stride % (count+1) for count, stride in zip(self.counts, self.strides)], axis=1)
+        self.totals = totals = self.remaining.sum(axis=1)
+
+        # For each kind of card, the states it can be drawn from, the states that
+        # leaves and the chance of drawing it
+        self.draws = []
+        for kind, stride in enumerate(self.strides):
+            from_states = np.flatnonzero(self.remaining[:, kind] > 0)
+            to_states = from_states - stride
+            to_states[totals[from_states] == 1] = self.full_state
+            self.draws.append((from_states, to_states, self.remaining[from_states, kind]/totals[from_states]))
+
+    """
+    Returns the chance of being in each state at a random point in the game. How
+    many cards are left is equally likely to be anything from 1 to the size of
+    the deck, and for each of those every set of cards is as likely as it is
+    when dealing that many cards from a full deck.
+    """
+    def stationary(self):
+        totals = self.remaining.sum(axis=1)
+        ways = np.prod([[math.comb(count, remaining) for count, remaining in zip(self.counts, state)] for state in self.remaining], axis=1)
+        deals = np.array([math.comb(self.size, total) for total in totals], dtype=float)
+        return np.where(totals > 0, ways/deals/self.size, 0.0)
+
+class ExtendedModel(object):
+    def __init__(self, rules=None, jail_turns=0, community_deck=True, chance_deck=True):
+        self.model = TransitionModel(rules)
+        self.rules = self.model.rules
+        self.jail_turns = jail_turns
+        self.community_deck = DeckModel(list(self.rules.community_cards)) if community_deck else None
+        self.chance_deck = DeckModel(list(self.rules.chance_cards)) if chance_deck else None
+
+        # The position part of each state is a square and the doubles rolled in
+        # a row or, when waiting in jail, how many turns have been spent there
+        levels = self.model.doubles_levels
+        self.positions = [(square, level) for square in range(JAIL) for level in range(levels)]
+        self.positions += [(JAIL, level) for level in range(jail_turns or levels)]
+        self.position_index = {position: index for index, position in enumerate(self.positions)}
+        self.shape = (len(self.positions),
+                      self.community_deck.num_states if community_deck else 1,
+                      self.chance_deck.num_states if chance_deck else 1)
+        self.num_states = math.prod(self.shape)
+
+        # Where each roll leaves the token before drawing a card, as a dense matrix
+        # over the positions, transposed to multiply by
+        self.landing = np.zeros((len(self.positions), len(self.positions)))
+        for index, position in enumerate(self.positions):
+            for landed, probability in self.roll_outcomes(*position):
+                self.landing[self.position_index[landed], index] += probability
+
+        # Positions on a card square, with the axis of the deck that is drawn from
+        # (or None if the deck isn't tracked) and the position each kind of card
+        # sends the token to
+        self.card_positions = []
+        for index, (square, level) in enumerate(self.positions):
+            if square in self.rules.community_squares:
+                deck, axis, cards = self.community_deck, 1, self.rules.community_cards
+            elif square in self.rules.chance_squares:
+                deck, axis, cards = self.chance_deck, 2, self.rules.chance_cards
+            else:
+                continue
+            kinds = deck.kinds if deck else list(dict.fromkeys(cards))
+            targets = [self.position_index[self.land(self.model.card_square(square, kind), level)] for kind in kinds]
+            weights = [cards.count(kind)/len(cards) for kind in kinds]
+            self.card_positions.append((index, deck, axis, targets, weights))
+
+    def jail_position(self, level):
+        if self.jail_turns:
+            return (JAIL, 0) # waiting in jail, the doubles don't matter anymore
+        return (JAIL, level)
+
+    def land(self, square, level):
+        if square in (30, JAIL):
+            return self.jail_position(level)
+        return (square, level)
+
+    """
+    Returns a list of (position, probability) tuples for where each roll from
+    `square` leaves the token, before any card is drawn.
+    """
+    def roll_outcomes(self, square, level):
+        roll_probability = 1/len(Monopoly.roll_values)
+        outcomes = []
+        for roll_index, roll_value in enumerate(Monopoly.roll_values):
+            doubles = roll_index in Monopoly.double_indices
+            if square == JAIL and self.jail_turns:
+                if not doubles and level+1 < self.jail_turns:
+                    outcomes.append(((JAIL, level+1), roll_probability))
+                else: # rolled doubles or paid to get out, either way the turn ends
+                    outcomes.append(((self.model.move_spaces(JAIL, roll_value), 0), roll_probability))
+                continue
+            roll_doubles = min(level+1, 3) if doubles else 0
+            if roll_doubles == 3:
+                outcomes.append((self.jail_position(0 if self.rules.reset_doubles else 3), roll_probability))
+            else:
+                outcomes.append((self.land(self.model.move_spaces(square, roll_value), roll_doubles), roll_probability))
+        return outcomes
+
+    """
+    Returns the bytes needed to solve the model: the probability vector, the next
+    one and a copy of the probabilities on the card squares.
+    """
+    def memory_needed(self):
+        deck_states = self.shape[1]*self.shape[2]
+        return (2*len(self.positions) + len(self.card_positions))*deck_states*np.dtype(float).itemsize
+
+    """
+    Returns a probability vector to start iterating from. It's the stationary
+    distribution of `TransitionModel` with the decks independent of the
+    position, which is already close.
+    """
+    def start_vector(self):
+        vector = self.model.start_vector()
+        for i in range(500):
+            vector = self.model.step(vector)
+        positions = np.zeros(len(self.positions))
+        for state, probability in enumerate(vector):
+            square, level = self.model.state_info(state)
+            positions[self.position_index[self.jail_position(level) if square == JAIL else (square, level)]] += probability
+        community = self.community_deck.stationary() if self.community_deck else np.ones(1)
+        chance = self.chance_deck.stationary() if self.chance_deck else np.ones(1)
+        return positions[:, None, None] * community[None, :, None] * chance[None, None, :]
+
+    """
+    Advance the probability `vector` over the states by one turn. When a `drawn`
+    list is passed in, the probability of drawing from the Community Chest deck
+    and from the Chance deck is added to it, for each state of the decks.
+    """
+    def step(self, vector, drawn=None):
+        landed = (self.landing @ vector.reshape(len(self.positions), -1)).reshape(self.shape)
+        # Take all of the draws out first, a card can move the token to another
+        # card square but it doesn't draw again
+        drawings = [landed[index].copy() for index, deck, axis, targets, weights in self.card_positions]
+        for index, deck, axis, targets, weights in self.card_positions:
+            landed[index] = 0
+        if drawn is not None:
+            for draw_axis in (1, 2):
+                drawn.append(sum((drawing for drawing, card_position in zip(drawings, self.card_positions) if card_position[2] == draw_axis),
+                                 np.zeros(self.shape[1:])))
+        for drawing, (index, deck, axis, targets, weights) in zip(drawings, self.card_positions):
+            for kind, target in enumerate(targets):
+                if deck is None:
+                    landed[target] += drawing*weights[kind]
+                    continue
+                from_states, to_states, probabilities = deck.draws[kind]
+                if axis == 1:
+                    landed[target][to_states] += drawing[from_states]*probabilities[:, None]
+                else:
+                    landed[target][:, to_states] += drawing[:, from_states]*probabilities
+        return landed
+
+    """
+    Returns the stationary distribution, the number of iterations it took and
+    the total change of the last iteration. Stops once the total change is below
+    `tolerance` or after `max_iterations`.
+    """
+    def stationary(self, tolerance=1e-10, max_iterations=10000):
+        vector = self.start_vector()
+        for iteration in range(1, max_iterations+1):
+            drawn = []
+            next_vector = self.step(vector, drawn)
+            if self.community_deck or self.chance_deck:
+                self.correct_deck_totals(vector, next_vector, *drawn)
+            # The last vector isn't needed anymore, work out the change in its memory
+            change = np.abs(np.subtract(next_vector, vector, out=vector), out=vector).sum()
+            vector = next_vector
+            if change < tolerance:
+                break
+        return vector, iteration, change
+
+    """
+    Rescales `next_vector` in place so the number of cards left in the decks has
+    the right distribution. Power iteration is slow to get this right on its own,
+    the decks go around in cycles that only move when a card is drawn. So the
+    chain is lumped together by how many cards are left in each deck, which is
+    small enough to solve directly, using the chance of drawing from each deck
+    in `vector` (`community_drawn` and `chance_drawn` from `step`).
+    """
+    def correct_deck_totals(self, vector, next_vector, community_drawn, chance_drawn):
+        community_size = self.community_deck.size if self.community_deck else 0
+        chance_size = self.chance_deck.size if self.chance_deck else 0
+        community_totals = self.community_deck.totals if self.community_deck else np.zeros(1, dtype=int)
+        chance_totals = self.chance_deck.totals if self.chance_deck else np.zeros(1, dtype=int)
+        labels = (community_totals[:, None]*(chance_size+1) + chance_totals[None, :]).ravel()
+        num_groups = (community_size+1)*(chance_size+1)
+
+        probabilities = np.bincount(labels, vector.sum(axis=0).ravel(), num_groups)
+        groups = np.arange(num_groups)
+        community_left, chance_left = np.divmod(groups, chance_size+1)
+        transitions = np.zeros((num_groups, num_groups))
+        transitions[groups, groups] = probabilities
+        if self.community_deck:
+            drawn = np.bincount(labels, community_drawn.ravel(), num_groups)
+            next_groups = np.where(community_left > 1, community_left-1, community_size)*(chance_size+1) + chance_left
+            np.add.at(transitions, (groups, next_groups), drawn)
+            transitions[groups, groups] -= drawn
+        if self.chance_deck:
+            drawn = np.bincount(labels, chance_drawn.ravel(), num_groups)
+            next_groups = community_left*(chance_size+1) + np.where(chance_left > 1, chance_left-1, chance_size)
+            np.add.at(transitions, (groups, next_groups), drawn)
+            transitions[groups, groups] -= drawn
+
+        # Solve for the stationary distribution of the groups that are reachable
+        active = probabilities > 0
+        transitions = transitions[active][:, active]/probabilities[active, None]
+        equations = transitions.T - np.eye(len(transitions))
+        equations[-1] = 1
+        solution = np.zeros(len(transitions))
+        solution[-1] = 1
+        stationary = np.zeros(num_groups)
+        stationary[active] = np.clip(np.linalg.solve(equations, solution), 0, None)
+
+        next_probabilities = np.bincount(labels, next_vector.sum(axis=0).ravel(), num_groups)
+        scale = np.divide(stationary, next_probabilities, out=np.zeros(num_groups), where=next_probabilities > 0)
+        next_vector *= scale[labels].reshape(self.shape[1:])
+
+    """
+    Collapse a probability vector over the states into the probability of
+    ending on each square.
+    """
+    def square_probabilities(self, vector):
+        probabilities = [0.0 for square in range(JAIL+1)]
+        for position, probability in zip(self.positions, vector.sum(axis=(1, 2))):
+            probabilities[position[0]] += float(probability)
+        return probabilities
+
+def save_probabilities(probabilities, results_dir=None):
+    results_dir = make_results_dir(results_dir)
+    board_spaces = load_board_spaces()
+
+    console.print(f"\n[bold]Saving in[/] [magenta]{results_dir}[/]:")
+
+    probs_csv = results_dir / 'board-probabilities-extended.csv'
+    with probs_csv.open('w') as fprobs_csv:
+        for probability, board_space in zip(probabilities, board_spaces):
+            fprobs_csv.write(f"{board_space.name},{probability:.5%}\n")
+    console.print(" •", probs_csv.name, style="cyan")
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m app.extended", description="Calculate the exact probabilities with the decks and/or staying in jail as part of the state.")
+    parser.add_argument("--rules", help="The rules to play by. (Default: 'standard')", choices=RULES, default="standard")
+    parser.add_argument("--jail-turns", help="Stay in jail for up to JAIL_TURNS turns trying to roll doubles. (Default: 0, leave on the next turn like the simulation)", type=int, default=0)
+    parser.add_argument("--no-community-deck", help="Draw Community Chest cards from the full deck every time.", action="store_true")
+    parser.add_argument("--no-chance-deck", help="Draw Chance cards from the full deck every time.", action="store_true")
+    parser.add_argument("--tolerance", help="Stop once the probabilities change by less than this in total in an iteration. (Default: 1e-10)", type=float, default=1e-10)
+    parser.add_argument("--max-iterations", help="The most iterations to run. (Default: 10000)", type=int, default=10000)
+    parser.add_argument("--max-memory", help="The most memory to use in MB, larger models aren't solved. (Default: 2048)", type=int, default=2048)
+    parser.add_argument("--results-dir", help="The directory to store the results in. (Default: 'results')")
+    flags = parser.parse_args()
+
+    model = ExtendedModel(RULES[flags.rules], flags.jail_turns, not flags.no_community_deck, not flags.no_chance_deck)
+    memory_needed = model.memory_needed()/2**20
+    console.print(f"[bold]{model.num_states:,}[/] states ({flags.rules} rules), needs about [bold]{memory_needed:,.0f} MB[/]")
+    if memory_needed > flags.max_memory:
+        console.print(f"That is more than --max-memory ({flags.max_memory:,} MB), try not tracking one of the decks.", style="red")
+        return
+
+    start = time.monotonic()
+    with console.status("Iterating"):
+        vector, iterations, change = model.stationary(flags.tolerance, flags.max_iterations)
+    duration = time.monotonic() - start
+    if change >= flags.tolerance:
+        console.print(f"Didn't converge in {pluralize(iterations,'iteration',',')} (last change {change:.2e})", style="yellow")
+
+    console.rule("[bold]Results")
+    print()
+    console.print(f"  Run time: [cyan]{pretty_duration(duration)}")
+    console.print(f"Iterations: [cyan]{iterations:,}")
+    save_probabilities(model.square_probabilities(vector), flags.results_dir)
+
+if __name__ == '__main__':
+    main()
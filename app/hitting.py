@@ -0,0 +1,141 @@
+"""
+How long it takes to get to each square, worked out from `TransitionModel`
+instead of playing lots of short games:
+
+    - The expected number of turns until a turn first ends on each square,
+      starting from Go and from jail. For every square this is a linear system
+      over the states, they are all solved in one batch.
+    - The expected number of turns until a turn ends on each colour group (and
+      the railroads and utilities), and the chance of that happening within 1,
+      2, 3... turns, also from Go and from jail.
+
+A square is only reached by ending a turn on it, like the results count, so
+Go To Jail is never reached. Like `TransitionModel` every card is drawn from the
+full deck, a game that goes through its shuffled decks gets to the squares the
+cards send you to a little sooner. Run with:
+
+python -m app.hitting
+"""
+
+import argparse, time
+
+import numpy as np
+
+from .monopoly import JAIL
+from .rules import RULES
+from .sensitivity import transition_matrix, stationary_distribution, square_probabilities, DOUBLES_LEVELS
+from .utils import console, load_board_spaces, make_results_dir, pretty_duration
+
+COLOR_GROUPS = {
+    "Brown": (1, 3),
+    "Light Blue": (6, 8, 9),
+    "Pink": (11, 13, 14),
+    "Orange": (16, 18, 19),
+    "Red": (21, 23, 24),
+    "Yellow": (26, 27, 29),
+    "Green": (31, 32, 34),
+    "Dark Blue": (37, 39),
+    "Railroads": (5, 15, 25, 35),
+    "Utilities": (12, 28),
+}
+STARTS = {"Go": 0, "Jail": JAIL}
+
+def square_states(squares):
+    return [square*DOUBLES_LEVELS + level for square in squares for level in range(DOUBLES_LEVELS)]
+
+def start_state(square):
+    return square*DOUBLES_LEVELS
+
+"""
+Returns the expected number of turns until a turn ends in each of the `targets`
+(lists of states) from every state, one row per target. Each target is a system
+h = 1 + P h over the states outside it (h is 0 inside it), so all of the systems
+are solved together. Starting inside a target counts the turns until it is
+reached again.
+"""
+def hitting_times(matrix, targets):
+    size = len(matrix)
+    systems = np.repeat((np.eye(size) - matrix)[np.newaxis], len(targets), axis=0)
+    constants = np.ones((len(targets), size))
+    for index, states in enumerate(targets):
+        systems[index, states] = 0
+        systems[index, states, states] = 1
+        constants[index, states] = 0
+    turns = np.linalg.solve(systems, constants[..., np.newaxis])[..., 0]
+    return 1 + turns @ matrix.T # take the first turn, so starting inside a target isn't 0
+
+"""
+Returns the chance of a turn ending in each of the `targets` within 1 to
+`max_turns` turns from every state, as an array indexed by the number of turns
+(minus 1), the state and the target.
+"""
+def hit_within(matrix, targets, max_turns):
+    inside = np.zeros((len(matrix), len(targets)))
+    for index, states in enumerate(targets):
+        inside[states, index] = 1
+    chances = np.zeros_like(inside)
+    all_chances = []
+    for turn in range(max_turns):
+        chances = matrix @ (inside + (1 - inside)*chances)
+        all_chances.append(chances)
+    return np.array(all_chances)
+
+"""
+Save the expected turns to reach each square and each group, and the chances of
+reaching each group, to csv files.
+"""
+def save_hitting(expected_turns, group_hits, results_dir=None):
+    results_dir = make_results_dir(results_dir)
+    board_spaces = load_board_spaces()
+
+    console.print(f"\n[bold]Saving in[/] [magenta]{results_dir}[/]:")
+
+    hitting_csv = results_dir / 'board-hitting-times.csv'
+    with hitting_csv.open('w') as fhitting:
+        fhitting.write(",".join(["Square"] + [f"Turns From {start}" for start in STARTS]) + "\n")
+        for square, board_space in enumerate(board_spaces):
+            turns = [f"{expected_turns[start][square]:.4f}" if square in expected_turns[start] else "" for start in STARTS]
+            fhitting.write(",".join([board_space.name] + turns) + "\n")
+    console.print(" •", hitting_csv.name, style="cyan")
+
+    groups_csv = results_dir / 'board-group-hits.csv'
+    with groups_csv.open('w') as fgroups:
+        max_turns = len(next(iter(group_hits.values()))[1])
+        fgroups.write(",".join(["Group", "From", "Expected Turns"] + [f"Within {turns}" for turns in range(1, max_turns+1)]) + "\n")
+        for (group, start), (turns, chances) in group_hits.items():
+            fgroups.write(",".join([group, start, f"{turns:.4f}"] + [f"{chance:.4%}" for chance in chances]) + "\n")
+    console.print(" •", groups_csv.name, style="cyan")
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m app.hitting", description="Calculate the expected turns to reach each square and the chance of reaching each colour group within a number of turns.")
+    parser.add_argument("--rules", help="The rules to play by. (Default: 'standard')", choices=RULES, default="standard")
+    parser.add_argument("--max-turns", help="Work out the chance of reaching each group within 1 to MAX_TURNS turns. (Default: 20)", type=int, default=20)
+    parser.add_argument("--results-dir", help="The directory to store the results in. (Default: 'results')")
+    flags = parser.parse_args()
+
+    start = time.monotonic()
+    matrix = transition_matrix(RULES[flags.rules])
+    probabilities = square_probabilities(stationary_distribution(matrix))
+    squares = [square for square in range(JAIL+1) if probabilities[square] > 0] # Go To Jail can't be reached
+    times = hitting_times(matrix, [square_states([square]) for square in squares])
+    expected_turns = {start_name: {square: times[index, start_state(start_square)] for index, square in enumerate(squares)}
+                      for start_name, start_square in STARTS.items()}
+    groups = [square_states(group) for group in COLOR_GROUPS.values()]
+    group_times = hitting_times(matrix, groups)
+    chances = hit_within(matrix, groups, flags.max_turns)
+    group_hits = {(group, start_name): (group_times[index, start_state(start_square)], chances[:, start_state(start_square), index])
+                  for index, group in enumerate(COLOR_GROUPS) for start_name, start_square in STARTS.items()}
+    duration = time.monotonic() - start
+
+    console.rule("[bold]Results")
+    print()
+    console.print(f"[bold]{'Group':<12} Expected turns    Within {flags.max_turns} turns[/] [dim](from Go / from jail)")
+    for group in COLOR_GROUPS:
+        (go_turns, go_chances), (jail_turns, jail_chances) = group_hits[(group, "Go")], group_hits[(group, "Jail")]
+        console.print(f"{group:<12} [cyan]{go_turns:5.2f}[/] / [cyan]{jail_turns:5.2f}[/]   [cyan]{go_chances[-1]:6.2%}[/] / [cyan]{jail_chances[-1]:6.2%}")
+    print()
+    console.print(f"  Run time: [cyan]{pretty_duration(duration)}")
+    save_hitting(expected_turns, group_hits, flags.results_dir)
+
+if __name__ == '__main__':
+    main()
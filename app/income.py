@@ -0,0 +1,156 @@
+"""
+What each property earns once the probabilities are known. For every property,
+build level and number of players (2 to 8) it works out the expected rent per
+turn of an opponent, per round of the game (every opponent taking a turn), and
+how many rounds it takes to earn back what was spent on it. The whole grid is
+one numpy broadcast over the prices and rents in 'property-rents.txt'.
+
+The probabilities come from the raw counts of a run in a result store (see
+`app.store`), so nothing has to be simulated again, or from `TransitionModel`
+(which draws every card from the full deck) when there is no store. Run with:
+
+python -m app.income --store STORE_DIR
+"""
+
+import argparse, sys
+
+import numpy as np
+
+from .rules import RULES
+from .sensitivity import transition_matrix, stationary_distribution, square_probabilities
+from .store import ResultStore, describe_scenario
+from .utils import console, load_board_spaces, load_property_rents, make_results_dir
+
+PLAYERS = np.arange(2, 9)
+MOVES_PER_TURN = 1 + 1/6 + 1/36 # rolling doubles moves again, up to 3 times
+AVERAGE_ROLL = 7 # what utility rents multiply, the dice that got there aren't known
+LEVELS = {
+    "street": ["Unimproved", "Full group", "1 house", "2 houses", "3 houses", "4 houses", "Hotel"],
+    "railroad": ["1 owned", "2 owned", "3 owned", "4 owned"],
+    "utility": ["1 owned", "2 owned"],
+}
+NUM_LEVELS = max(len(levels) for levels in LEVELS.values())
+
+"""
+Returns the rent and what has been spent on each property at each build level,
+as property by level arrays. Levels a property doesn't have are NaN. A street
+charges double rent without houses when its whole colour group is owned. Each
+railroad and utility only counts its own price, its rent is just higher when
+more of them are owned.
+"""
+def rent_table(properties):
+    rents = np.full((len(properties), NUM_LEVELS), np.nan)
+    investments = np.full((len(properties), NUM_LEVELS), np.nan)
+    for index, property in enumerate(properties):
+        if property.kind == "street":
+            base, *built = property.rents
+            rents[index, :len(LEVELS["street"])] = [base, 2*base] + built
+            investments[index, :len(LEVELS["street"])] = [property.price, property.price] + [property.price + houses*property.build_cost for houses in range(1, len(built)+1)]
+        else:
+            multiplier = AVERAGE_ROLL if property.kind == "utility" else 1
+            rents[index, :len(property.rents)] = [rent*multiplier for rent in property.rents]
+            investments[index, :len(property.rents)] = property.price
+    return rents, investments
+
+"""
+Returns the expected rent per opponent turn (property by level) and per round
+and the rounds to break even (property by level by number of players) for the
+probability of ending a move on each square.
+"""
+def income_grid(probabilities, properties):
+    rents, investments = rent_table(properties)
+    squares = np.array([property.square for property in properties])
+    per_turn = probabilities[squares, np.newaxis]*MOVES_PER_TURN*rents
+    per_round = per_turn[..., np.newaxis]*(PLAYERS - 1)
+    break_even = investments[..., np.newaxis]/per_round
+    return per_turn, per_round, investments, break_even
+
+"""
+Returns the probabilities and a description of where they came from. With a
+`store` they are from the counts of the scenario whose key starts with `key`,
+or of the latest run in the store, otherwise from `TransitionModel` for `rules`.
+Runs of 0 turns are skipped, they don't have any probabilities.
+"""
+def load_probabilities(store_dir=None, key=None, rules=None):
+    if store_dir is None:
+        probabilities = square_probabilities(stationary_distribution(transition_matrix(rules)))
+        return probabilities, f"Markov model, {rules.name} rules"
+    store = ResultStore(store_dir)
+    entries = store.entries()
+    if key is not None:
+        entries = [entry for entry in entries if entry["key"].startswith(key)]
+        if len({entry["key"] for entry in entries}) > 1:
+            raise ValueError(f"More than one scenario matches '{key}'")
+    if not entries:
+        raise ValueError("No scenario matches" + (f" '{key}'" if key is not None else ", the store is empty"))
+    entries = [entry for entry in entries if entry["moves"] > 0]
+    if not entries:
+        raise ValueError("Every matching run has 0 moves, there are no probabilities to use")
+    entry = entries[-1]
+    counts = store.counts()[entry["row"]]
+    return counts/counts.sum(), f"{entry['key']}, {describe_scenario(entry['scenario'])}"
+
+"""
+Returns the (property index, level) of every level each property has.
+"""
+def grid_rows(properties):
+    return [(index, level) for index, property in enumerate(properties) for level in range(len(LEVELS[property.kind]))]
+
+def save_income(properties, per_turn, per_round, investments, break_even, results_dir=None):
+    results_dir = make_results_dir(results_dir)
+    board_spaces = load_board_spaces()
+    rows = grid_rows(properties)
+
+    console.print(f"\n[bold]Saving in[/] [magenta]{results_dir}[/]:")
+
+    income_csv = results_dir / 'property-income.csv'
+    with income_csv.open('w') as fincome:
+        fincome.write(",".join(["Property", "Level", "Investment", "Rent Per Opponent Turn"] + [f"Rent Per Round ({players} Players)" for players in PLAYERS]) + "\n")
+        for index, level in rows:
+            property = properties[index]
+            fincome.write(",".join([board_spaces[property.square].name, LEVELS[property.kind][level], f"{investments[index, level]:.0f}", f"{per_turn[index, level]:.4f}"] +
+                                   [f"{income:.4f}" for income in per_round[index, level]]) + "\n")
+    console.print(" •", income_csv.name, style="cyan")
+
+    break_even_csv = results_dir / 'property-break-even.csv'
+    with break_even_csv.open('w') as fbreak_even:
+        fbreak_even.write("Players,Rank,Property,Level,Investment,Rent Per Round,Rounds To Break Even\n")
+        for player_index, players in enumerate(PLAYERS):
+            ranked = sorted(rows, key=lambda row: break_even[row[0], row[1], player_index])
+            for rank, (index, level) in enumerate(ranked, 1):
+                property = properties[index]
+                fbreak_even.write(f"{players},{rank},{board_spaces[property.square].name},{LEVELS[property.kind][level]},{investments[index, level]:.0f},{per_round[index, level, player_index]:.4f},{break_even[index, level, player_index]:.2f}\n")
+    console.print(" •", break_even_csv.name, style="cyan")
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m app.income", description="Calculate the expected rent of every property at every build level for 2 to 8 players, and how long each takes to pay for itself.")
+    parser.add_argument("--store", help="Use the counts of a run in the result store in the STORE directory. Without it the probabilities of a Markov model of --rules are used, which draws every card from the full deck.")
+    parser.add_argument("--key", help="With --store, the key of the scenario to use (or the start of it). (Default: the latest run in the store)")
+    parser.add_argument("--rules", help="Without --store, the rules to calculate the probabilities for. (Default: 'standard')", choices=RULES, default="standard")
+    parser.add_argument("--players", help="The number of players to show the quickest properties to break even for. (Default: 4)", type=int, choices=PLAYERS.tolist(), default=4)
+    parser.add_argument("--top", help="How many of the quickest properties to break even to show. (Default: 10)", type=int, default=10)
+    parser.add_argument("--results-dir", help="The directory to store the results in. (Default: 'results')")
+    flags = parser.parse_args()
+
+    try:
+        probabilities, source = load_probabilities(flags.store, flags.key, RULES[flags.rules])
+    except ValueError as error:
+        console.print(str(error), style="bold red")
+        sys.exit(1)
+    properties = load_property_rents()
+    board_spaces = load_board_spaces()
+    per_turn, per_round, investments, break_even = income_grid(probabilities, properties)
+
+    console.print(f"Probabilities from [cyan]{source}")
+    console.rule(f"[bold]Quickest to break even with {flags.players} players")
+    print()
+    player_index = flags.players - PLAYERS[0]
+    rows = grid_rows(properties)
+    for index, level in sorted(rows, key=lambda row: break_even[row[0], row[1], player_index])[:flags.top]:
+        property = properties[index]
+        name = f"{board_spaces[property.square].name} ({LEVELS[property.kind][level]})"
+        console.print(f"{name:<38} [cyan]{break_even[index, level, player_index]:7.1f}[/] rounds [dim](${per_round[index, level, player_index]:.2f} a round for ${investments[index, level]:.0f})")
+    save_income(properties, per_turn, per_round, investments, break_even, flags.results_dir)
+
+if __name__ == '__main__':
+    main()
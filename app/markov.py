@@ -0,0 +1,116 @@
+from .monopoly import Monopoly, JAIL
+from .rules import STANDARD_RULES
+
+"""
+A model of the `Monopoly` class as a Markov chain, with a memoryless-deck
+approximation of the cards. Each state is a square on the board paired with the
+number of doubles rolled in a row. With rules that don't reset the doubles count
+after going to jail, the last level counts 3 or more doubles in a row. Cards are
+treated as being drawn at random from the full deck every time, so the decks
+don't need to be part of the state. The engines go through each shuffled deck
+before reshuffling, which changes the probabilities a little (see
+`app.extended` for a model that tracks the decks).
+
+`doubles_levels` can be set to 4 to give every set of rules the same states,
+when they reset the doubles count the last level just can't be reached.
+"""
+class TransitionModel(object):
+    def __init__(self, rules=None, doubles_levels=None):
+        self.rules = rules or STANDARD_RULES
+        self.num_squares = Monopoly.num_spaces + 1 # +1 for jail, same as the results
+        self.doubles_levels = doubles_levels or (3 if self.rules.reset_doubles else 4)
+        self.num_states = self.num_squares * self.doubles_levels
+        self.rows = [self.transitions(*self.state_info(state)) for state in range(self.num_states)]
+
+    def state(self, position, doubles):
+        return position*self.doubles_levels + doubles
+
+    def state_info(self, state):
+        return divmod(state, self.doubles_levels)
+
+    """
+    Returns a list of (state, probability) tuples for every state that can be
+    reached in one turn from `position` with `doubles` doubles already rolled.
+    """
+    def transitions(self, position, doubles):
+        rules = self.rules
+        roll_probability = 1/len(Monopoly.roll_values)
+        row = {}
+        for roll_index, roll_value in enumerate(Monopoly.roll_values):
+            roll_doubles = min(doubles+1, 3) if roll_index in Monopoly.double_indices else 0
+            if roll_doubles == 3:
+                outcomes = [(JAIL, 1)]
+                if rules.reset_doubles:
+                    roll_doubles = 0
+            else:
+                square = self.move_spaces(position, roll_value)
+                if square in rules.community_squares:
+                    outcomes = self.draw_card(square, rules.community_cards)
+                elif square in rules.chance_squares:
+                    outcomes = self.draw_card(square, rules.chance_cards)
+                else:
+                    outcomes = [(square, 1)]
+                outcomes = [(JAIL if square == 30 else square, probability) for square, probability in outcomes]
+            for square, probability in outcomes:
+                state = self.state(square, roll_doubles)
+                row[state] = row.get(state, 0) + roll_probability*probability
+        return list(row.items())
+
+    def move_spaces(self, position, spaces):
+        if position == JAIL:
+            position = 10
+        return (position + spaces) % Monopoly.num_spaces
+
+    def draw_card(self, square, cards):
+        card_probability = 1/len(cards)
+        return [(self.card_square(square, card), card_probability) for card in cards]
+
+    def card_square(self, square, card):
+        if card == 'U':
+            return 28 if square > 12 and square < 28 else 12
+        elif card == 'R':
+            distance_rr = (square+5)%10
+            if distance_rr != 0:
+                distance_rr = 10-distance_rr
+            return self.move_spaces(square, distance_rr)
+        elif card == 'B':
+            return self.move_spaces(square, -3)
+        elif card is not None:
+            return card
+        return square
+
+    def start_vector(self):
+        vector = [0.0 for i in range(self.num_states)]
+        vector[self.state(0, 0)] = 1.0
+        return vector
+
+    """
+    Advance the probability `vector` over the states by one turn.
+    """
+    def step(self, vector):
+        next_vector = [0.0 for i in range(self.num_states)]
+        for state, probability in enumerate(vector):
+            if probability:
+                for next_state, transition in self.rows[state]:
+                    next_vector[next_state] += probability*transition
+        return next_vector
+
+    """
+    Collapse a probability vector over the states into the probability of
+    ending on each square.
+    """
+    def square_probabilities(self, vector):
+        levels = self.doubles_levels
+        return [sum(vector[square*levels:(square+1)*levels]) for square in range(self.num_squares)]
+
+    """
+    Returns a list with the probability of ending on each square for each of the
+    first `turns` turns of a game that starts on Go.
+    """
+    def turn_distributions(self, turns):
+        distributions = []
+        vector = self.start_vector()
+        for turn in range(turns):
+            vector = self.step(vector)
+            distributions.append(self.square_probabilities(vector))
+        return distributions
@@ -0,0 +1,145 @@
+import os, json, platform, time
+
+from .utils import console, make_results_dir, peak_rss, PyMonopoly, FastMonopoly, CMonopoly, LaneMonopoly, VARIANT
+
+METRICS_JSON = 'metrics.json'
+METRICS_PROM = 'metrics.prom'
+
+def engine_name(monopoly_cls):
+    if monopoly_cls is PyMonopoly:
+        return "python"
+    if monopoly_cls is FastMonopoly:
+        return "python-fast"
+    if monopoly_cls is CMonopoly:
+        return "cython"
+    if monopoly_cls is LaneMonopoly:
+        return "lanes"
+    return "numba"
+
+"""
+Returns the version of monopoly-probabilities that is installed, or 'unknown' if
+it isn't (like when running from the source tree without installing it).
+"""
+def release():
+    try:
+        from importlib.metadata import version
+        return version("monopoly-probabilities")
+    except ImportError: # also covers PackageNotFoundError
+        return "unknown"
+
+"""
+Returns the CPU time used by this process and the workers it has finished with.
+Workers are only counted once their pool has closed.
+"""
+def cpu_time():
+    times = os.times()
+    return times.user + times.system + times.children_user + times.children_system
+
+"""
+Collects the metrics of a simulation into a dict:
+    - `wall_seconds` is the whole run, from `start` (a `time.perf_counter()`
+      value) until now.
+    - `simulation_seconds` is the time spent playing the games (in the pool when
+      running in parallel) and `export_seconds` the time spent saving the
+      results.
+    - `cpu_seconds` and `peak_rss_bytes` are for the main process, the CPU time
+      also counts the workers. Each worker has its own in `workers`.
+The engine and the build variant of the C extension (`None` for the other
+engines) say what was measured, the host and release where.
+"""
+def collect_metrics(result, worker_stats, monopoly_cls, rules, start, export_duration):
+    workers = [
+        {
+            "worker": worker,
+            "pid": stats.pid,
+            "moves": stats.moves,
+            "moves_per_sec": stats.moves/stats.duration if stats.duration > 0 else 0,
+            "seconds": stats.duration,
+            "cpu_seconds": stats.cpu_time,
+            "peak_rss_bytes": stats.peak_rss,
+        }
+        for worker, stats in enumerate(worker_stats)
+    ]
+    return {
+        "timestamp": time.time(),
+        "host": platform.node(),
+        "release": release(),
+        "engine": engine_name(monopoly_cls),
+        "variant": VARIANT if monopoly_cls in (CMonopoly, LaneMonopoly) else None,
+        "rules": rules.name,
+        "cores": result.num_cores_used,
+        "moves": result.total_turns,
+        "moves_per_sec": result.total_turns/result.duration if result.duration > 0 else 0,
+        "wall_seconds": time.perf_counter() - start,
+        "simulation_seconds": result.duration,
+        "export_seconds": export_duration,
+        "cpu_seconds": cpu_time(),
+        "peak_rss_bytes": peak_rss(),
+        "workers": workers,
+    }
+
+# name, help, key in the metrics
+RUN_METRICS = [
+    ("monopoly_moves", "Moves simulated.", "moves"),
+    ("monopoly_moves_per_second", "Moves simulated per second of simulation time.", "moves_per_sec"),
+    ("monopoly_cores", "Cores used for the simulation.", "cores"),
+    ("monopoly_wall_seconds", "Wall time of the whole run.", "wall_seconds"),
+    ("monopoly_simulation_seconds", "Wall time spent playing the games.", "simulation_seconds"),
+    ("monopoly_export_seconds", "Wall time spent saving the results.", "export_seconds"),
+    ("monopoly_cpu_seconds", "CPU time of the main process and its workers.", "cpu_seconds"),
+    ("monopoly_peak_rss_bytes", "Peak resident memory of the main process.", "peak_rss_bytes"),
+]
+WORKER_METRICS = [
+    ("monopoly_worker_moves", "Moves simulated by the worker.", "moves"),
+    ("monopoly_worker_moves_per_second", "Moves simulated per second by the worker.", "moves_per_sec"),
+    ("monopoly_worker_seconds", "Wall time the worker spent playing.", "seconds"),
+    ("monopoly_worker_cpu_seconds", "CPU time the worker spent playing.", "cpu_seconds"),
+    ("monopoly_worker_peak_rss_bytes", "Peak resident memory of the worker process.", "peak_rss_bytes"),
+]
+
+"""
+Returns the metrics in the Prometheus text format, for the node exporter's
+textfile collector or a Pushgateway. Every sample is labelled with the engine,
+variant, rules, host and release so runs can be told apart, the worker metrics
+are also labelled with the worker. Metrics that couldn't be measured are left
+out.
+"""
+def prometheus_text(metrics):
+    def escape(value):
+        return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+    def format_labels(labels):
+        return ",".join(f'{name}="{escape(value)}"' for name, value in labels.items())
+
+    labels = {name: metrics[name] if metrics[name] is not None else "none" for name in ("engine", "variant", "rules", "host", "release")}
+    lines = []
+    def add_metric(name, help, samples):
+        lines.append(f"# HELP {name} {help}")
+        lines.append(f"# TYPE {name} gauge")
+        for sample_labels, value in samples:
+            if value is not None:
+                lines.append(f"{name}{{{format_labels(sample_labels)}}} {value}")
+
+    for name, help, key in RUN_METRICS:
+        add_metric(name, help, [(labels, metrics[key])])
+    for name, help, key in WORKER_METRICS:
+        add_metric(name, help, [({**labels, "worker": worker["worker"]}, worker[key]) for worker in metrics["workers"]])
+    add_metric("monopoly_run_timestamp_seconds", "When the run finished, in seconds since the epoch.", [(labels, metrics["timestamp"])])
+    return "\n".join(lines) + "\n"
+
+"""
+Save the metrics of the run as json and in the Prometheus text format. The
+Prometheus file is written next to where it goes and then moved there, so a
+collector never reads half of it.
+"""
+def save_metrics(metrics, results_dir=None):
+    results_dir = make_results_dir(results_dir)
+
+    metrics_json = results_dir / METRICS_JSON
+    metrics_json.write_text(json.dumps(metrics, indent=4))
+    console.print(" •", metrics_json.name, style="cyan")
+
+    metrics_prom = results_dir / METRICS_PROM
+    partial_prom = metrics_prom.with_name(metrics_prom.name + '.partial')
+    partial_prom.write_text(prometheus_text(metrics))
+    os.replace(partial_prom, metrics_prom)
+    console.print(" •", metrics_prom.name, style="cyan")
@@ -1,47 +1,150 @@
-from random import random
+from random import getrandbits
 
-JAIL = 40
+from .rules import JAIL, STANDARD_RULES
+
+# Histogram sizes for tracking visits, the last bucket of each also counts
+# everything longer
+VISIT_GAP_BUCKETS = 128 # turns between visits to a square, 1 to 128+
+JAIL_STAY_BUCKETS = 16  # turns in a row spent in jail, 1 to 16+
+
+# Each turn is recorded in a trace as a single byte
+TRACE_POSITION = 0x3f # the square the turn ended on
+TRACE_CARD = 0x40     # a card moved the token
+TRACE_DOUBLES = 0x80  # doubles were rolled
+TRACE_BUFFER_SIZE = 1 << 20 # bytes to hold onto before appending them to the file
+
+ROLL_BLOCK_SIZE = 1 << 16  # random bytes to turn into dice rolls at a time
+BYTE_BLOCK_SIZE = 1 << 12  # random bytes to make at a time for shuffling
+DICE_TABLE = bytes(value % 36 for value in range(256))
+DICE_REJECTED = bytes(range(252, 256)) # 252 is 7*36, keeping these would make the first 4 rolls more likely
+
+def random_bytes(size):
+    return getrandbits(8*size).to_bytes(size, 'little')
+
+"""
+Returns a block of dice rolls as bytes, each one a roll index from 0 to 35 with
+every roll equally likely. The bytes that can't be spread evenly over the 36
+rolls are left out, so there are a few less rolls than `size`.
+"""
+def random_rolls(size=ROLL_BLOCK_SIZE):
+    return random_bytes(size).translate(DICE_TABLE, DICE_REJECTED)
+
+"""
+Hands out random numbers from big blocks that are made all at once, instead of
+calling `random` for every roll and every card in a shuffle. A new block is made
+when the last one runs out. The blocks come from the `random` module, so seeding
+it still makes the games repeatable. The blocks are only made once the game
+starts playing, so games that are sent to other processes don't share them.
+"""
+class RandomBlocks(object):
+    def __init__(self):
+        self.rolls = b''
+        self.roll_cursor = 0
+        self.bytes = b''
+        self.byte_cursor = 0
+
+    def roll(self):
+        try:
+            roll_index = self.rolls[self.roll_cursor]
+        except IndexError:
+            self.rolls = random_rolls()
+            self.roll_cursor = 0
+            roll_index = self.rolls[0]
+        self.roll_cursor += 1
+        return roll_index
+
+    """
+    Returns the next rolls as bytes, at least 1 and at most `count`.
+    """
+    def take_rolls(self, count):
+        if self.roll_cursor == len(self.rolls):
+            self.rolls = random_rolls()
+            self.roll_cursor = 0
+        rolls = self.rolls[self.roll_cursor:self.roll_cursor+count]
+        self.roll_cursor += len(rolls)
+        return rolls
+
+    """
+    Returns a random number from 0 to `n`-1, for `n` up to 256. Bytes at the top
+    that would make the lower numbers more likely are skipped.
+    """
+    def below(self, n):
+        limit = 256 - 256 % n
+        while True:
+            if self.byte_cursor == len(self.bytes):
+                self.bytes = random_bytes(BYTE_BLOCK_SIZE)
+                self.byte_cursor = 0
+            value = self.bytes[self.byte_cursor]
+            self.byte_cursor += 1
+            if value < limit:
+                return value % n
+
+    """
+    Shuffles `deck` in place (Fisher-Yates). Each card can swap with any card
+    at or below it, including itself, so every order is equally likely.
+    """
+    def shuffle(self, deck):
+        for i in range(len(deck)-1, 0, -1):
+            r = self.below(i+1)
+            deck[r], deck[i] = deck[i], deck[r]
 
 class Monopoly(object):
     num_spaces = 40
-    community_squares = {2,17,33} # this is correct, but differs from maths.py  # THIS IS WHERE THE DESCREPANCY
-    chance_squares = {7,22,36} # this is correct, but differs from maths.py     # IN PROBABILITIES COMES FROM
-    community_cards = [0,JAIL] + [None for i in range(14)] # Two cards change your position, the rest don't matter
-    chance_cards = [0,5,11,24,39,'U','R','B',JAIL] + [None for i in range(7)] # 9 cards change your position
     roll_values = [2,3,4,5,6,7,3,4,5,6,7,8,4,5,6,7,8,9,5,6,7,8,9,10,6,7,8,9,10,11,7,8,9,10,11,12] # all possible combos of dice rolls
     double_indices = {0,7,14,21,28,35}                                                            # more efficient than rolling dice twice
 
-    def __init__(self):
+    def __init__(self, rules=None, track_visits=False, trace_path=None):
+        rules = rules or STANDARD_RULES
+        self.community_squares = set(rules.community_squares)
+        self.chance_squares = set(rules.chance_squares)
+        self.community_cards = list(rules.community_cards)
+        self.chance_cards = list(rules.chance_cards)
+        self.reset_doubles = rules.reset_doubles
         self.community_deck = []
         self.chance_deck = []
         self.results = [0 for i in range(self.num_spaces+1)] # +1 because we are counting jail vs visiting separately
         self.total_turns = 0
         self.current_position = 0
         self.doubles = 0
+        self.track_visits = track_visits
+        if track_visits:
+            self.last_visit = [-1 for i in range(self.num_spaces+1)]
+            self.visit_gaps = [0 for i in range((self.num_spaces+1)*VISIT_GAP_BUCKETS)] # flattened, one row of buckets per square
+            self.jail_stays = [0 for i in range(JAIL_STAY_BUCKETS)]
+            self.jail_stay = 0
+        self.trace_path = trace_path
+        self.trace_buffer = bytearray()
+        self.rolled_doubles = False
+        self.card_moved = False
+        self.random = RandomBlocks()
 
     def take_turns(self, turns):
         while self.total_turns < turns:
             spaces = self.roll_dice()
-            if self.doubles == 3:
+            if self.doubles >= 3:
                 self.move_to(JAIL)
-                self.doubles = 0 # reset after 3 doubles (differs from maths.py)
+                if self.reset_doubles:
+                    self.doubles = 0 # reset after 3 doubles (differs from maths.py)
             else:
                 self.move_spaces(spaces)
-                if self.current_position == 30: # Go to Jail
-                    self.move_to(JAIL)
-                elif self.current_position in self.community_squares:
+                if self.current_position in self.community_squares:
                     self.draw_community_chest()
                 elif self.current_position in self.chance_squares:
                     self.draw_chance()
+                if self.current_position == 30: # Go to Jail (checked after cards, 'B' can land here with maths.py rules)
+                    self.move_to(JAIL)
             self.end_turn()
+        if self.trace_path is not None:
+            self.flush_trace()
 
     def roll_dice(self):
-        # roll_index = random.randrange(36) # This seems to take a little longer
-        roll_index = int(random()*36)
+        roll_index = self.random.roll()
         if roll_index in self.double_indices:
             self.doubles+=1
+            self.rolled_doubles = True
         else:
             self.doubles = 0
+            self.rolled_doubles = False
         return self.roll_values[roll_index]
 
     def move_spaces(self, spaces):
@@ -56,8 +159,41 @@ class Monopoly(object):
 
     def end_turn(self):
         self.results[self.current_position]+=1
+        if self.track_visits:
+            self.record_visit()
+        if self.trace_path is not None:
+            self.record_trace()
         self.total_turns+=1
 
+    def record_visit(self):
+        position = self.current_position
+        last_visit = self.last_visit[position]
+        if last_visit >= 0:
+            gap = min(self.total_turns - last_visit, VISIT_GAP_BUCKETS)
+            self.visit_gaps[position*VISIT_GAP_BUCKETS + gap-1]+=1
+        self.last_visit[position] = self.total_turns
+        if position == JAIL:
+            self.jail_stay+=1
+        elif self.jail_stay > 0:
+            self.jail_stays[min(self.jail_stay, JAIL_STAY_BUCKETS)-1]+=1
+            self.jail_stay = 0
+
+    def record_trace(self):
+        record = self.current_position
+        if self.card_moved:
+            record |= TRACE_CARD
+            self.card_moved = False
+        if self.rolled_doubles:
+            record |= TRACE_DOUBLES
+        self.trace_buffer.append(record)
+        if len(self.trace_buffer) >= TRACE_BUFFER_SIZE:
+            self.flush_trace()
+
+    def flush_trace(self):
+        with open(self.trace_path, 'ab') as ftrace:
+            ftrace.write(self.trace_buffer)
+        self.trace_buffer.clear()
+
     def move_to_utility(self):
         if self.current_position > 12 and self.current_position < 28:
             self.move_to(28)
@@ -76,6 +212,7 @@ class Monopoly(object):
             self.community_deck = self.shuffle_deck(self.community_cards)
         card = self.community_deck.pop()
         if card is not None:
+            self.card_moved = True
             self.move_to(card)
 
     def draw_chance(self):
@@ -83,6 +220,8 @@ class Monopoly(object):
             # self.chance_deck = random.sample(self.chance_cards, len(self.chance_cards))
             self.chance_deck = self.shuffle_deck(self.chance_cards)
         card = self.chance_deck.pop()
+        if card is not None:
+            self.card_moved = True
         if card == 'U':
             self.move_to_utility()
         elif card == 'R':
@@ -94,10 +233,113 @@ class Monopoly(object):
 
     def shuffle_deck(self, deck):
         shuffled = deck.copy()
-        n = len(shuffled)
-        for i in range(n-1,0,-1):
-            r = int(random()*i)
-            move = shuffled[r]
-            shuffled[r] = shuffled[i]
-            shuffled[i] = move
+        self.random.shuffle(shuffled)
         return shuffled
+
+# Square kinds for FastMonopoly
+SQUARE_PLAIN = 0
+SQUARE_COMMUNITY = 1
+SQUARE_CHANCE = 2
+SQUARE_GO_TO_JAIL = 3
+
+"""
+Returns the square drawing `card` on `square` sends you to, which is jail rather
+than Go to Jail.
+"""
+def card_target(square, card):
+    if card is None:
+        target = square
+    elif card == 'U':
+        target = 28 if square > 12 and square < 28 else 12
+    elif card == 'R':
+        target = (square + (10 - (square+5)%10)%10) % 40
+    elif card == 'B':
+        target = square - 3
+    else:
+        target = card
+    return JAIL if target == 30 else target
+
+"""
+The same game as `Monopoly` with everything worked out ahead of time, so each
+turn is just a few list lookups on local variables:
+    - `moves` has the square each dice roll takes you to from each square.
+    - `square_kinds` says if a square is a card square or Go to Jail.
+    - The cards in the decks are tuples with the square the card sends you to
+      from each square.
+The decks are shuffled in place when they run out, and the turns are taken a
+block of dice rolls at a time. It doesn't record visit stats or traces.
+"""
+class FastMonopoly(object):
+    track_visits = False
+
+    def __init__(self, rules=None, track_visits=False, trace_path=None):
+        if track_visits or trace_path is not None:
+            raise ValueError("FastMonopoly can't record visit stats or traces")
+        rules = rules or STANDARD_RULES
+        self.moves = []
+        for square in range(JAIL+1):
+            start = 10 if square == JAIL else square # in jail, move from just visiting
+            self.moves.append(tuple((start + spaces) % 40 for spaces in Monopoly.roll_values))
+        self.doubles_rolls = [roll_index in Monopoly.double_indices for roll_index in range(len(Monopoly.roll_values))]
+        self.square_kinds = [SQUARE_COMMUNITY if square in rules.community_squares else
+                             SQUARE_CHANCE if square in rules.chance_squares else
+                             SQUARE_GO_TO_JAIL if square == 30 else
+                             SQUARE_PLAIN for square in range(40)]
+        self.community_cards = [tuple(card_target(square, card) for square in range(40)) for card in rules.community_cards]
+        self.chance_cards = [tuple(card_target(square, card) for square in range(40)) for card in rules.chance_cards]
+        self.reset_doubles = rules.reset_doubles
+        self.community_deck = []
+        self.chance_deck = []
+        self.results = [0 for i in range(JAIL+1)] # +1 because we are counting jail vs visiting separately
+        self.total_turns = 0
+        self.current_position = 0
+        self.doubles = 0
+        self.random = RandomBlocks()
+
+    def take_turns(self, turns):
+        moves = self.moves
+        doubles_rolls = self.doubles_rolls
+        square_kinds = self.square_kinds
+        reset_doubles = self.reset_doubles
+        community_cards = self.community_cards
+        chance_cards = self.chance_cards
+        community_deck = self.community_deck
+        chance_deck = self.chance_deck
+        results = self.results
+        position = self.current_position
+        doubles = self.doubles
+        take_rolls = self.random.take_rolls
+        shuffle = self.random.shuffle
+        turn = self.total_turns
+        while turn < turns:
+            rolls = take_rolls(turns - turn)
+            turn += len(rolls)
+            for roll_index in rolls:
+                if doubles_rolls[roll_index]:
+                    doubles += 1
+                    if doubles >= 3:
+                        if reset_doubles:
+                            doubles = 0 # reset after 3 doubles (differs from maths.py)
+                        position = JAIL
+                        results[JAIL] += 1
+                        continue
+                else:
+                    doubles = 0
+                position = moves[position][roll_index]
+                kind = square_kinds[position]
+                if kind == SQUARE_COMMUNITY:
+                    if not community_deck:
+                        community_deck.extend(community_cards)
+                        shuffle(community_deck)
+                    position = community_deck.pop()[position]
+                elif kind == SQUARE_CHANCE:
+                    if not chance_deck:
+                        chance_deck.extend(chance_cards)
+                        shuffle(chance_deck)
+                    position = chance_deck.pop()[position]
+                elif kind == SQUARE_GO_TO_JAIL:
+                    position = JAIL
+                results[position] += 1
+        self.current_position = position
+        self.doubles = doubles
+        self.total_turns = max(turns, self.total_turns)
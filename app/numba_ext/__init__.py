@@ -0,0 +1,6 @@
+"""
+The Monopoly class compiled with Numba. It is for when the C extension can't be
+built, Numba only needs to be installed (`pip install numba`), no compiler. This
+raises an ImportError without it.
+"""
+from .monopoly import Monopoly
@@ -0,0 +1,152 @@
+from random import getrandbits
+
+import numpy as np
+from numba import njit
+
+from ..rules import JAIL, STANDARD_RULES
+
+CHUNK_TURNS = 1 << 22 # turns per call into the compiled code, Ctrl-C is checked between them
+
+# Card codes, cards that send you to a square are the square
+CARD_NONE = -1
+CARD_UTILITY = -2
+CARD_RAILROAD = -3
+CARD_BACK = -4
+
+# Square kinds
+SQUARE_PLAIN = 0
+SQUARE_COMMUNITY = 1
+SQUARE_CHANCE = 2
+SQUARE_GO_TO_JAIL = 3
+
+# Indexes into the state array
+TOTAL_TURNS = 0
+POSITION = 1
+DOUBLES = 2
+COMMUNITY_LEFT = 3
+CHANCE_LEFT = 4
+
+ROLL_VALUES = np.array([2,3,4,5,6,7,3,4,5,6,7,8,4,5,6,7,8,9,5,6,7,8,9,10,6,7,8,9,10,11,7,8,9,10,11,12], dtype=np.int64)
+DOUBLE_ROLLS = np.array([i in (0,7,14,21,28,35) for i in range(36)])
+
+def card_code(card):
+    if card is None:
+        return CARD_NONE
+    elif card == 'U':
+        return CARD_UTILITY
+    elif card == 'R':
+        return CARD_RAILROAD
+    elif card == 'B':
+        return CARD_BACK
+    return card
+
+@njit(cache=True)
+def next_random(random_state):
+    # splitmix64
+    random_state[0] += np.uint64(0x9e3779b97f4a7c15)
+    z = random_state[0]
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xbf58476d1ce4e5b9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94d049bb133111eb)
+    return z ^ (z >> np.uint64(31))
+
+# Multiplies the top 32 bits by n and keeps the top of the product (Lemire's method),
+# drawing again for the few values that would make some results more likely
+@njit(cache=True)
+def random_below(random_state, n):
+    n = np.uint64(n)
+    product = (next_random(random_state) >> np.uint64(32)) * n
+    if (product & np.uint64(0xffffffff)) < n:
+        threshold = (np.uint64(1 << 32) - n) % n
+        while (product & np.uint64(0xffffffff)) < threshold:
+            product = (next_random(random_state) >> np.uint64(32)) * n
+    return np.int64(product >> np.uint64(32))
+
+@njit(cache=True)
+def draw_card(position, deck, cards, state, left_index, random_state):
+    if state[left_index] == 0:
+        deck[:] = cards
+        for i in range(len(deck)-1, 0, -1):
+            r = random_below(random_state, i+1)
+            deck[r], deck[i] = deck[i], deck[r]
+        state[left_index] = len(deck)
+    state[left_index] -= 1
+    card = deck[state[left_index]]
+    if card == CARD_NONE:
+        return position
+    elif card == CARD_UTILITY:
+        return 28 if position > 12 and position < 28 else 12
+    elif card == CARD_RAILROAD:
+        position += (10 - (position+5)%10)%10
+        return position - 40 if position >= 40 else position
+    elif card == CARD_BACK:
+        return position - 3
+    return card
+
+@njit(cache=True)
+def take_turns(turns, state, results, random_state, square_kinds, community_cards, community_deck, chance_cards, chance_deck, reset_doubles):
+    position = state[POSITION]
+    doubles = state[DOUBLES]
+    for turn in range(state[TOTAL_TURNS], turns):
+        roll_index = random_below(random_state, 36)
+        doubles = doubles+1 if DOUBLE_ROLLS[roll_index] else 0
+        if doubles >= 3:
+            position = JAIL
+            if reset_doubles:
+                doubles = 0
+        else:
+            if position == JAIL:
+                position = 10
+            position += ROLL_VALUES[roll_index]
+            if position >= 40:
+                position -= 40
+            kind = square_kinds[position]
+            if kind == SQUARE_COMMUNITY:
+                position = draw_card(position, community_deck, community_cards, state, COMMUNITY_LEFT, random_state)
+            elif kind == SQUARE_CHANCE:
+                position = draw_card(position, chance_deck, chance_cards, state, CHANCE_LEFT, random_state)
+            if position == 30:
+                position = JAIL
+        results[position] += 1
+    state[POSITION] = position
+    state[DOUBLES] = doubles
+    state[TOTAL_TURNS] = max(turns, state[TOTAL_TURNS])
+
+"""
+Plays the game with all of its state in numpy arrays so the turns can be taken
+by compiled code. The dice and shuffles use their own random number generator
+(seeded from `random`). The compiled code is cached on disk, so it is only
+compiled the first time it is used. It doesn't record visit stats or traces.
+"""
+class Monopoly(object):
+    track_visits = False
+
+    def __init__(self, rules=None, track_visits=False, trace_path=None):
+        if track_visits or trace_path is not None:
+            raise ValueError("The Numba Monopoly class can't record visit stats or traces")
+        rules = rules or STANDARD_RULES
+        self.square_kinds = np.array([SQUARE_COMMUNITY if square in rules.community_squares else
+                                      SQUARE_CHANCE if square in rules.chance_squares else
+                                      SQUARE_GO_TO_JAIL if square == 30 else
+                                      SQUARE_PLAIN for square in range(JAIL)], dtype=np.int64)
+        self.community_cards = np.array([card_code(card) for card in rules.community_cards], dtype=np.int64)
+        self.chance_cards = np.array([card_code(card) for card in rules.chance_cards], dtype=np.int64)
+        self.community_deck = np.empty_like(self.community_cards)
+        self.chance_deck = np.empty_like(self.chance_cards)
+        self.reset_doubles = rules.reset_doubles
+        self.state = np.zeros(5, dtype=np.int64)
+        self.random_state = np.array([getrandbits(64)], dtype=np.uint64)
+        self.game_results = np.zeros(JAIL+1, dtype=np.int64) # +1 because we are counting jail vs visiting separately
+
+    @property
+    def results(self):
+        return self.game_results.tolist()
+
+    @property
+    def total_turns(self):
+        return int(self.state[TOTAL_TURNS])
+
+    def take_turns(self, turns):
+        while self.total_turns < turns:
+            take_turns(min(turns, self.total_turns + CHUNK_TURNS), self.state, self.game_results, self.random_state,
+                       self.square_kinds, self.community_cards, self.community_deck, self.chance_cards, self.chance_deck,
+                       self.reset_doubles)
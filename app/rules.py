@@ -0,0 +1,36 @@
+from collections import namedtuple
+
+JAIL = 40
+
+"""
+The parts of the game that differ between rule sets. The Monopoly classes take
+one of these so they can play by either set of rules.
+
+    - `reset_doubles`: After going to jail for rolling 3 doubles in a row, start
+      counting doubles from 0 again.
+"""
+Rules = namedtuple("Rules", ["name", "community_squares", "chance_squares",
+                             "community_cards", "chance_cards", "reset_doubles"])
+
+STANDARD_RULES = Rules(
+    name = "standard",
+    community_squares = frozenset({2,17,33}), # this is correct, but differs from maths.py  # THIS IS WHERE THE DESCREPANCY
+    chance_squares = frozenset({7,22,36}),    # this is correct, but differs from maths.py  # IN PROBABILITIES COMES FROM
+    community_cards = (0,JAIL) + tuple(None for i in range(14)), # Two cards change your position, the rest don't matter
+    chance_cards = (0,5,11,24,39,'U','R','B',JAIL) + tuple(None for i in range(7)), # 9 cards change your position
+    reset_doubles = True
+)
+
+"""
+The rules used in the standupmaths video (see maths.py). Chance and Community
+Chest are on the wrong squares and the doubles count is not reset after going to
+jail, so every doubles rolled after the third one also goes to jail.
+"""
+REFERENCE_RULES = STANDARD_RULES._replace(
+    name = "reference",
+    community_squares = frozenset({2,17}),
+    chance_squares = frozenset({7,22,33}),
+    reset_doubles = False
+)
+
+RULES = {rules.name: rules for rules in (STANDARD_RULES, REFERENCE_RULES)}
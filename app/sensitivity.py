@@ -0,0 +1,186 @@
+"""
+How much the probability of each square changes when the rules change a little,
+like swapping a blank Chance card for another Go to Jail card, without
+simulating again. The changes are worked out from `TransitionModel`:
+
+    - The first order change of the stationary distribution π for a change ΔP
+      of the transition matrix P is π ΔP Z, where Z = (I - P + 1π)⁻¹ is the
+      fundamental matrix of the chain.
+    - The exact change δ solves δ = (π + δ) ΔP Z, which is iterated starting
+      from the first order change. Z is only worked out once, for the rules
+      that are changed, so every change after that is a few products with it.
+      A change too big for that to converge is solved directly instead.
+
+Run with:
+
+python -m app.sensitivity
+"""
+
+import argparse, time
+
+import numpy as np
+
+from .markov import TransitionModel
+from .monopoly import JAIL
+from .rules import RULES
+from .utils import console, load_board_spaces, make_results_dir, pretty_duration
+
+DOUBLES_LEVELS = 4 # the same states for every set of rules, so they can be compared
+CARDS = (0, 5, 11, 24, 39, 'U', 'R', 'B', JAIL) # every card that moves the token
+
+def transition_matrix(rules):
+    model = TransitionModel(rules, DOUBLES_LEVELS)
+    matrix = np.zeros((model.num_states, model.num_states))
+    for state, row in enumerate(model.rows):
+        for next_state, probability in row:
+            matrix[state, next_state] += probability
+    return matrix
+
+"""
+Solves π(I - P) = 0 with the probabilities adding up to 1, by replacing one of
+the equations with that.
+"""
+def stationary_distribution(matrix):
+    size = len(matrix)
+    equations = (np.eye(size) - matrix).T
+    equations[-1] = 1
+    constants = np.zeros(size)
+    constants[-1] = 1
+    return np.linalg.solve(equations, constants)
+
+def square_probabilities(vector):
+    return vector.reshape(-1, DOUBLES_LEVELS).sum(axis=1)
+
+def card_name(card, board_spaces):
+    if card is None:
+        return "blank"
+    if card == JAIL:
+        return "Go to Jail"
+    if card == 'U':
+        return "nearest Utility"
+    if card == 'R':
+        return "nearest Railroad"
+    if card == 'B':
+        return "back 3 spaces"
+    return f"advance to {board_spaces[card].name}"
+
+"""
+Returns the changes to try, as (description, changed rules) tuples: swapping a
+blank card of each deck for each card that moves the token and the other way
+around, adding and removing a blank card, and flipping whether the doubles count
+is reset after going to jail.
+"""
+def rule_changes(rules, board_spaces):
+    changes = []
+    for deck_name, field in (("Community Chest", "community_cards"), ("Chance", "chance_cards")):
+        cards = getattr(rules, field)
+        def changed(cards):
+            return rules._replace(**{field: tuple(cards)})
+        if None in cards:
+            blank = cards.index(None)
+            for card in CARDS:
+                changes.append((f"{deck_name}: a blank card becomes {card_name(card, board_spaces)}", changed(cards[:blank] + (card,) + cards[blank+1:])))
+            changes.append((f"{deck_name}: one less blank card", changed(cards[:blank] + cards[blank+1:])))
+        for card in dict.fromkeys(cards):
+            if card is not None:
+                index = cards.index(card)
+                changes.append((f"{deck_name}: {card_name(card, board_spaces)} becomes a blank card", changed(cards[:index] + (None,) + cards[index+1:])))
+        changes.append((f"{deck_name}: one more blank card", changed(cards + (None,))))
+    changes.append(("Doubles count " + ("not reset" if rules.reset_doubles else "reset") + " after going to jail", rules._replace(reset_doubles=not rules.reset_doubles)))
+    return changes
+
+class Sensitivity(object):
+    def __init__(self, rules):
+        self.rules = rules
+        self.matrix = transition_matrix(rules)
+        self.stationary = stationary_distribution(self.matrix)
+        size = len(self.matrix)
+        self.fundamental = np.linalg.inv(np.eye(size) - self.matrix + np.outer(np.ones(size), self.stationary))
+
+    """
+    Returns the first order change of the stationary distribution when the
+    transition matrix becomes `matrix`.
+    """
+    def first_order(self, matrix):
+        return self.stationary @ (matrix - self.matrix) @ self.fundamental
+
+    """
+    Returns the stationary distribution when the transition matrix becomes
+    `matrix`, starting from the first order change.
+    """
+    def exact(self, matrix, tolerance=1e-15, max_iterations=200):
+        change_fundamental = (matrix - self.matrix) @ self.fundamental
+        delta = self.stationary @ change_fundamental
+        for iteration in range(max_iterations):
+            next_delta = (self.stationary + delta) @ change_fundamental
+            converged = np.abs(next_delta - delta).sum() < tolerance
+            delta = next_delta
+            if converged:
+                return self.stationary + delta
+            if not np.isfinite(delta).all():
+                break
+        return stationary_distribution(matrix)
+
+    """
+    Returns a (description, first order changes, exact changes) tuple for each
+    rule change, with the changes of the probability of each square.
+    """
+    def square_changes(self, changes):
+        base = square_probabilities(self.stationary)
+        results = []
+        for description, rules in changes:
+            matrix = transition_matrix(rules)
+            first_order = square_probabilities(self.first_order(matrix))
+            exact = square_probabilities(self.exact(matrix)) - base
+            results.append((description, first_order, exact))
+        return results
+
+"""
+Save every change of every square to a csv file. The rows of each square are
+ranked by how much its probability changes.
+"""
+def save_sensitivity(base, results, results_dir=None):
+    results_dir = make_results_dir(results_dir)
+    board_spaces = load_board_spaces()
+
+    console.print(f"\n[bold]Saving in[/] [magenta]{results_dir}[/]:")
+
+    sensitivity_csv = results_dir / 'board-sensitivity.csv'
+    with sensitivity_csv.open('w') as fsensitivity:
+        fsensitivity.write("Square,Rank,Change,Probability,Changed Probability,Difference,First Order Difference\n")
+        for square, board_space in enumerate(board_spaces):
+            ranked = sorted(results, key=lambda result: abs(result[2][square]), reverse=True)
+            for rank, (description, first_order, exact) in enumerate(ranked, 1):
+                fsensitivity.write(f"{board_space.name},{rank},\"{description}\",{base[square]:.5%},{base[square] + exact[square]:.5%},{exact[square]:+.5%},{first_order[square]:+.5%}\n")
+    console.print(" •", sensitivity_csv.name, style="cyan")
+
+def main():
+    board_spaces = load_board_spaces()
+    parser = argparse.ArgumentParser(prog="python -m app.sensitivity", description="Calculate how much the probability of each square changes with small changes to the rules.")
+    parser.add_argument("--rules", help="The rules to change. (Default: 'standard')", choices=RULES, default="standard")
+    parser.add_argument("--square", help="The square to show the biggest changes for, by number (0 is Go, 40 is In Jail). (Default: 39, Boardwalk)", type=int, choices=range(JAIL+1), metavar="SQUARE", default=39)
+    parser.add_argument("--top", help="How many of the biggest changes to show. (Default: 10)", type=int, default=10)
+    parser.add_argument("--results-dir", help="The directory to store the results in. (Default: 'results')")
+    flags = parser.parse_args()
+
+    start = time.monotonic()
+    rules = RULES[flags.rules]
+    sensitivity = Sensitivity(rules)
+    results = sensitivity.square_changes(rule_changes(rules, board_spaces))
+    duration = time.monotonic() - start
+    base = square_probabilities(sensitivity.stationary)
+
+    console.rule(f"[bold]{board_spaces[flags.square].name}")
+    print()
+    console.print(f"Probability: [cyan]{base[flags.square]:.3%}[/] ({flags.rules} rules)\n")
+    console.print("[bold]Change   [dim](first order)[/] Rule change")
+    ranked = sorted(results, key=lambda result: abs(result[2][flags.square]), reverse=True)
+    for description, first_order, exact in ranked[:flags.top]:
+        console.print(f"[cyan]{exact[flags.square]:+.4%}[/] [dim]({first_order[flags.square]:+.4%})[/]   {description}")
+    print()
+    console.print(f"  Run time: [cyan]{pretty_duration(duration)}")
+    console.print(f"   Changes: [cyan]{len(results)}")
+    save_sensitivity(base, results, flags.results_dir)
+
+if __name__ == '__main__':
+    main()
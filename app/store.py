@@ -0,0 +1,192 @@
+"""
+An append-only store for the results of many simulations, so sweeps over rules,
+seeds or engines don't leave behind a directory of files for every run. The
+counts of every run are one fixed-width row of int64s in `counts.i64`, and
+`index.jsonl` has a line for each row saying what scenario it is the results of,
+keyed by a hash of the scenario. Running a scenario again adds another row, the
+latest one is the one that counts.
+
+Runs are added with `monopoly --store STORE_DIR`. The counts file is
+memory-mapped to answer questions about everything in the store at once:
+
+python -m app.store STORE_DIR list
+python -m app.store STORE_DIR top
+python -m app.store STORE_DIR show KEY
+
+The questions need numpy (the `analysis` extra), adding runs doesn't.
+"""
+
+import argparse, hashlib, json, sys, time
+from array import array
+from pathlib import Path
+
+from .monopoly import JAIL
+from .utils import console, load_board_spaces
+
+STORE_COUNTS = 'counts.i64'
+STORE_INDEX = 'index.jsonl'
+ROW_SQUARES = JAIL+1
+ROW_BYTES = ROW_SQUARES*8
+
+"""
+Returns the scenario a simulation was run for, as a dict that can be saved as
+json. The rules are spelled out instead of just named, so changing a rule set
+makes it a different scenario.
+"""
+def make_scenario(rules, engine, turns=None, time_budget=None):
+    def jsonable(value):
+        if isinstance(value, frozenset):
+            return sorted(value)
+        if isinstance(value, tuple):
+            return list(value)
+        return value
+    return {
+        "rules": {field: jsonable(value) for field, value in rules._asdict().items()},
+        "engine": engine,
+        "turns": turns,
+        "time_budget": time_budget,
+    }
+
+def scenario_key(scenario):
+    return hashlib.sha256(json.dumps(scenario, sort_keys=True).encode()).hexdigest()[:16]
+
+def describe_scenario(scenario):
+    size = f"{scenario['turns']:,} moves" if scenario["turns"] is not None else f"{scenario['time_budget']:g}s"
+    return f"{scenario['rules']['name']} rules, {scenario['engine']}, {size}"
+
+class ResultStore(object):
+    def __init__(self, store_dir):
+        self.store_dir = Path(store_dir).resolve()
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        self.counts_path = self.store_dir / STORE_COUNTS
+        self.index_path = self.store_dir / STORE_INDEX
+
+    """
+    Returns every line of the index, oldest first. A line that was cut off
+    (the run was stopped while adding it) is ignored.
+    """
+    def entries(self):
+        if not self.index_path.exists():
+            return []
+        entries = []
+        with self.index_path.open() as index:
+            for line in index:
+                try:
+                    entries.append(json.loads(line))
+                except ValueError:
+                    pass
+        return entries
+
+    """
+    Returns the latest entry for each scenario key, in the order the scenarios
+    were first added. With `played` only runs that made any moves count, a run of
+    0 turns has no probabilities.
+    """
+    def latest(self, played=False):
+        latest = {}
+        for entry in self.entries():
+            if not played or entry["moves"] > 0:
+                latest[entry["key"]] = entry
+        return latest
+
+    def __contains__(self, key):
+        return key in self.latest()
+
+    """
+    Adds the `results` of a run of `scenario` to the store and returns its key.
+    The counts are written before the index line that points to them, so a run
+    that is stopped part way never leaves the index pointing at a row that isn't
+    there. A row that was only partly written is cut off before adding the next.
+    A run of 0 turns has empty results, it is added as a row of zeros.
+    """
+    def add(self, scenario, results):
+        if not results:
+            results = [0]*ROW_SQUARES
+        if len(results) != ROW_SQUARES:
+            raise ValueError(f"Expected {ROW_SQUARES} counts, got {len(results)}")
+        counts = array('q', results)
+        if sys.byteorder == 'big':
+            counts.byteswap() # the file is always little-endian
+        with self.counts_path.open('ab') as counts_file:
+            size = counts_file.tell()
+            if size % ROW_BYTES:
+                size -= size % ROW_BYTES
+                counts_file.truncate(size)
+            counts_file.write(counts.tobytes())
+        key = scenario_key(scenario)
+        entry = {"key": key, "row": size // ROW_BYTES, "moves": sum(results), "timestamp": time.time(), "scenario": scenario}
+        with self.index_path.open('a') as index:
+            index.write(json.dumps(entry) + "\n")
+        return key
+
+    """
+    Returns the counts of every row in the store as a read-only memory-mapped
+    numpy array, one row per run.
+    """
+    def counts(self):
+        import numpy as np
+        rows = self.counts_path.stat().st_size // ROW_BYTES if self.counts_path.exists() else 0
+        if rows == 0:
+            return np.zeros((0, ROW_SQUARES), dtype='<i8')
+        return np.memmap(self.counts_path, dtype='<i8', mode='r', shape=(rows, ROW_SQUARES))
+
+    """
+    Returns the keys of the latest run of every scenario and a matrix with the
+    probabilities of landing on each square, one row per scenario. Scenarios
+    that only have runs of 0 turns are left out.
+    """
+    def probabilities(self):
+        import numpy as np
+        latest = self.latest(played=True)
+        rows = np.array([entry["row"] for entry in latest.values()], dtype=np.int64)
+        counts = self.counts()[rows]
+        return list(latest), counts/np.maximum(counts.sum(axis=1, keepdims=True), 1)
+
+    """
+    Returns the squares that are in the top `k` of the most scenarios, as
+    (square, number of scenarios, mean probability) tuples, most first.
+    """
+    def top_squares(self, k=5):
+        import numpy as np
+        keys, probabilities = self.probabilities()
+        if not keys:
+            return []
+        top = np.argsort(-probabilities, axis=1, kind='stable')[:, :k]
+        appearances = np.bincount(top.ravel(), minlength=ROW_SQUARES)
+        means = probabilities.mean(axis=0)
+        order = np.lexsort((-means, -appearances))
+        return [(int(square), int(appearances[square]), float(means[square])) for square in order if appearances[square]]
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m app.store", description="Answer questions about the runs in a result store.")
+    parser.add_argument("store_dir", help="The directory of the result store.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("list", help="List the scenarios in the store.")
+    top_parser = commands.add_parser("top", help="The squares that are most often among the most landed on across all scenarios.")
+    top_parser.add_argument("-k", help="How many of the most landed on squares to count for each scenario. (Default: 5)", type=int, default=5)
+    show_parser = commands.add_parser("show", help="The probabilities of a scenario.")
+    show_parser.add_argument("key", help="The key of the scenario (or the start of it).")
+    flags = parser.parse_args()
+
+    store = ResultStore(flags.store_dir)
+    board_spaces = load_board_spaces()
+    if flags.command == "list":
+        for key, entry in store.latest().items():
+            console.print(f"[cyan]{key}[/] {describe_scenario(entry['scenario'])} [dim]({entry['moves']:,} moves)")
+    elif flags.command == "top":
+        keys, probabilities = store.probabilities()
+        console.print(f"Top {flags.k} squares across [bold]{len(keys)}[/] scenarios:\n")
+        for square, appearances, mean in store.top_squares(flags.k):
+            console.print(f"{board_spaces[square].name:<21} in [cyan]{appearances}[/] - mean {mean:.3%}")
+    else:
+        keys, probabilities = store.probabilities()
+        matches = [index for index, key in enumerate(keys) if key.startswith(flags.key)]
+        if len(matches) != 1:
+            console.print(f"{'No' if not matches else 'More than one'} scenario matches '{flags.key}'", style="bold red")
+            sys.exit(1)
+        console.print(describe_scenario(store.latest()[keys[matches[0]]]["scenario"]) + "\n")
+        for board_space, probability in zip(board_spaces, probabilities[matches[0]]):
+            console.print(f"{board_space.name:<21} - {probability:.3%}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,162 @@
+"""
+Answer questions about a simulation from the trace it recorded with
+`--record-trace`, without simulating again. The trace files are memory-mapped
+and worked through in blocks, so they can be far bigger than memory.
+
+Run with:
+
+python -m app.trace results/trace
+"""
+
+import json, math, sys
+from pathlib import Path
+
+import numpy as np
+
+from .markov import TransitionModel
+from .monopoly import Monopoly, JAIL, TRACE_POSITION, TRACE_CARD, TRACE_DOUBLES
+from .rules import RULES
+from .utils import console, load_board_spaces, TRACE_INFO
+
+BLOCK_SIZE = 1 << 24 # turns to work on at a time
+
+"""
+Returns a table for looking up if Go was passed during a turn. It is indexed by
+the square the turn started on, the square it ended on, and the card and doubles
+flags. The trace doesn't say which square a card was drawn from, so when a card
+sends the token to jail there can be more than one way to get there. Then the
+more likely one wins.
+"""
+def passed_go_table(rules):
+    model = TransitionModel(rules)
+    roll_probability = 1/len(Monopoly.roll_values)
+    weights = np.zeros((JAIL+1, JAIL+1, 2, 2, 2))
+    for start in range(JAIL+1):
+        start_square = 10 if start == JAIL else start
+        for roll_index, roll_value in enumerate(Monopoly.roll_values):
+            doubles = int(roll_index in Monopoly.double_indices)
+            square = model.move_spaces(start, roll_value)
+            passed = square < start_square
+            if square in rules.community_squares or square in rules.chance_squares:
+                cards = rules.community_cards if square in rules.community_squares else rules.chance_cards
+                outcomes = [(model.card_square(square, card), card is not None, card) for card in cards]
+                card_probability = 1/len(cards)
+            else:
+                outcomes = [(square, False, None)]
+                card_probability = 1
+            for end, card_moved, card in outcomes:
+                # Cards that advance you forwards pass Go if they wrap around the board
+                card_passed = card_moved and card not in ('B', JAIL) and end < square
+                end = JAIL if end == 30 else end
+                weights[start, end, int(card_moved), doubles, int(passed or card_passed)] += roll_probability*card_probability
+        # Rolling a third doubles goes straight to jail without moving
+        weights[start, JAIL, 0, 1, 0] += roll_probability
+    return (weights[..., 1] > weights[..., 0]).astype(np.uint8)
+
+class Trace(object):
+    def __init__(self, trace_dir):
+        self.trace_dir = Path(trace_dir)
+        info = json.loads((self.trace_dir / TRACE_INFO).read_text())
+        self.rules = RULES[info["rules"]]
+        self.games = [np.memmap(self.trace_dir / name, dtype=np.uint8, mode='r') for name in info["games"]]
+        self.total_turns = sum(len(game) for game in self.games)
+
+    """
+    Yields a game in blocks. Each block is yielded with the index of its first
+    turn and starts with the `overlap` turns that came right before it (padded
+    with Go at the start of the game, which is where it starts).
+    """
+    def blocks(self, game_index, overlap=1):
+        game = self.games[game_index]
+        previous = np.zeros(overlap, dtype=np.uint8)
+        for offset in range(0, len(game), BLOCK_SIZE):
+            block = np.concatenate((previous, game[offset:offset+BLOCK_SIZE]))
+            yield offset, block
+            previous = block[-overlap:]
+
+    """
+    Returns how many turns ended on each square.
+    """
+    def landing_counts(self):
+        counts = np.zeros(JAIL+1, dtype=np.int64)
+        for game_index in range(len(self.games)):
+            for offset, block in self.blocks(game_index):
+                counts += np.bincount(block[1:] & TRACE_POSITION, minlength=JAIL+1)
+        return counts
+
+    """
+    Returns the chance that Go is passed within the next 1 to `max_turns` turns,
+    from any turn of the game. They are all NaN if no game in the trace passed
+    Go, then there are no turns to count.
+    """
+    def passed_go_within(self, max_turns):
+        table = passed_go_table(self.rules)
+        gap_counts = np.zeros(max_turns+1, dtype=np.int64)
+        turns_counted = 0
+        for game_index in range(len(self.games)):
+            last_pass = -1
+            for offset, block in self.blocks(game_index):
+                start = block[:-1] & TRACE_POSITION
+                end = block[1:] & TRACE_POSITION
+                card_moved = (block[1:] & TRACE_CARD) != 0
+                doubles = (block[1:] & TRACE_DOUBLES) != 0
+                passes = np.flatnonzero(table[start, end, card_moved.view(np.uint8), doubles.view(np.uint8)]) + offset
+                if len(passes) == 0:
+                    continue
+                # The turns between two passes are within k turns of the next pass
+                # for the last k of them
+                gaps = np.diff(np.concatenate(([last_pass], passes)))
+                gap_counts += np.bincount(np.minimum(gaps, max_turns), minlength=max_turns+1)
+                last_pass = passes[-1]
+            # Turns after the last pass can't be counted, the trace ends first
+            turns_counted += last_pass + 1
+        if turns_counted == 0:
+            return [math.nan]*max_turns
+        gap_lengths = np.arange(max_turns+1)
+        return [float(np.minimum(gap_lengths, k).dot(gap_counts))/turns_counted for k in range(1, max_turns+1)]
+
+    """
+    Returns a dict with the number of times each sequence of `length` squares
+    came right before going to jail.
+    """
+    def jail_sequences(self, length=2):
+        sequences = {}
+        for game_index in range(len(self.games)):
+            for offset, block in self.blocks(game_index, length):
+                positions = block & TRACE_POSITION
+                entries = np.flatnonzero((positions[length:] == JAIL) & (positions[length-1:-1] != JAIL)) + length
+                if offset == 0:
+                    entries = entries[entries >= 2*length] # the padding isn't real turns
+                if len(entries) == 0:
+                    continue
+                before = np.stack([positions[entries-i] for i in range(length, 0, -1)], axis=1)
+                unique, counts = np.unique(before, axis=0, return_counts=True)
+                for sequence, count in zip(unique, counts):
+                    key = tuple(int(square) for square in sequence)
+                    sequences[key] = sequences.get(key, 0) + int(count)
+        return sequences
+
+def main():
+    trace_dir = sys.argv[1] if len(sys.argv) > 1 else "results/trace"
+    trace = Trace(trace_dir)
+    board_spaces = load_board_spaces()
+
+    console.print(f"[bold]{trace.total_turns:,}[/] turns in [bold]{len(trace.games)}[/] games ({trace.rules.name} rules)\n")
+
+    console.rule("[bold]Passing Go")
+    chances = trace.passed_go_within(6)
+    if math.isnan(chances[0]):
+        console.print("-- No game in the trace passed Go, record more turns --", style="yellow")
+    else:
+        for turns, chance in enumerate(chances, 1):
+            console.print(f"Within {turns} turn{'s' if turns != 1 else ''}: [cyan]{chance:.3%}")
+
+    console.rule("[bold]Squares before going to jail")
+    sequences = trace.jail_sequences(2)
+    total = sum(sequences.values())
+    for sequence, count in sorted(sequences.items(), key=lambda item: item[1], reverse=True)[:10]:
+        names = " → ".join(board_spaces[square].name for square in sequence)
+        console.print(f"{names:<60} [cyan]{count/total:.3%}")
+
+if __name__ == '__main__':
+    main()
@@ -1,17 +1,24 @@
-import threading, time, itertools, sys, os, signal
+import threading, queue, time, itertools, sys, os, signal, json
 import pygal
 from pathlib import Path
 import importlib.resources as resources
 from collections import namedtuple
 from contextlib import contextmanager
+from functools import lru_cache
 
 from . import data
 
-from .monopoly import Monopoly as PyMonopoly
+from .monopoly import Monopoly as PyMonopoly, FastMonopoly, VISIT_GAP_BUCKETS, JAIL_STAY_BUCKETS
 try:
-    from .cython_ext import Monopoly as CMonopoly
+    from .cython_ext import Monopoly as CMonopoly, LaneMonopoly, LANES, VARIANT
 except ImportError:
     CMonopoly = None
+    LaneMonopoly = None
+    VARIANT = None
+try:
+    import resource
+except ImportError: # not on Unix
+    resource = None
 
 from rich.console import Console, detect_legacy_windows
 from rich.style import Style
@@ -171,24 +178,44 @@ class Timer(object):
 
 BoardSpace = namedtuple("BoardSpace", ["name", "color"])
 
+"""
+A property from 'property-rents.txt'. `kind` is 'street', 'railroad' or
+'utility'. The `rents` of a street are without houses, then with 1 to 4 houses
+and a hotel, of a railroad with 1 to 4 railroads owned, and of a utility they
+are what the dice roll is multiplied by with 1 or 2 utilities owned.
+"""
+Property = namedtuple("Property", ["kind", "square", "price", "build_cost", "rents"])
+
+TRACE_INFO = 'trace.json'
+
+EXPORT_QUEUE_SIZE = 4 # exports that can wait for the background writer
+
+"""
+What a game sends back after playing its turns. The visit statistics are `None`
+unless the game was tracking visits. `worker_stats` is a list with the
+`WorkerStats` of each game.
+"""
+GameOutput = namedtuple("GameOutput", ["results", "visit_gaps", "jail_stays", "worker_stats"])
+
+"""
+How a game went for the process that played it: the moves it took, how long
+that took, the CPU time the process spent on it and the peak RSS of the process
+in bytes (`None` where that can't be measured).
+"""
+WorkerStats = namedtuple("WorkerStats", ["pid", "moves", "duration", "cpu_time", "peak_rss"])
+
 class Result():
-    def __init__(self, results, duration, num_cores_used):
+    def __init__(self, results, duration, num_cores_used, visit_gaps=None, jail_stays=None):
         self.results = results
         self.total_turns = sum(results)
         self.percentages = [result/self.total_turns for result in results]
         self.duration = duration
         self.num_cores_used = num_cores_used
+        self.visit_gaps = visit_gaps
+        self.jail_stays = jail_stays
 
     def pretty_duration(self, highlight=False):
-        if self.duration is None:
-            return ''
-        duration_str = ''
-        mins, secs = divmod(self.duration, 60)
-        if mins > 0:
-            duration_str = f"{pluralize(mins,'min','.0f',highlight)} "
-        format = '.0f' if mins > 0 else '.2f'
-        duration_str += f"{pluralize(secs,'sec',format,highlight)}"
-        return duration_str
+        return pretty_duration(self.duration, highlight)
 
     def pretty_total_turns(self, highlight=False):
         return pluralize(self.total_turns,'move',',',highlight)
@@ -197,42 +224,211 @@ class Result():
         return pluralize(self.num_cores_used, 'cpu core', highlight=highlight)
 
 """
-Returns either the C extension or pure Python version of the Monopoly class
-depending on:
-    - What was requested with the `pure_python` argument.
-    - If the C extension is requested then it depends if it is available.
+Runs exports (like `save_results`) on a thread in the background, so the main
+thread can get back to handing out games while the results are formatted and
+written. At most `max_pending` exports wait in the queue, after that `submit`
+waits for the writer to catch up so finished results can't pile up in memory.
+Closing the writer waits for every export that was submitted. If an export
+fails, the ones after it are skipped and the error is raised when the writer is
+closed.
+"""
+class ExportWriter(object):
+    def __init__(self, max_pending=EXPORT_QUEUE_SIZE):
+        self.queue = queue.Queue(max_pending)
+        self.thread = None
+        self.error = None
+
+    def __enter__(self):
+        self.thread = threading.Thread(target=self._write, daemon=True)
+        self.thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, traceback):
+        self.queue.put(None)
+        self.thread.join()
+        if self.error is not None and exc_type is None:
+            raise self.error
+        return False
+
+    def submit(self, export, *args):
+        self.queue.put((export, args))
+
+    def _write(self):
+        for export, args in iter(self.queue.get, None):
+            if self.error is not None:
+                continue # keep emptying the queue so `submit` doesn't wait forever
+            try:
+                export(*args)
+            except Exception as error:
+                self.error = error
+
+TIME_BUDGET_CHUNK_SECONDS = 0.05 # how long each chunk of a game played until a deadline should take
+WARM_UP_TURNS = 1000 # turns a worker plays before its time budget starts, to load or compile the engine
+
+ENGINES = ["auto", "cython", "lanes", "numba", "python"]
+
+"""
+Returns the Numba version of the Monopoly class, or None if Numba isn't
+installed. Importing Numba takes a while, so this is only done when it is going
+to be used.
+"""
+def load_numba_monopoly():
+    try:
+        from .numba_ext import Monopoly as NumbaMonopoly
+    except ImportError:
+        return None
+    return NumbaMonopoly
+
+"""
+Returns the Monopoly class for the `engine` that was requested:
+    - 'cython' is the C extension.
+    - 'lanes' is the C extension playing several games side by side.
+    - 'numba' is compiled with Numba, for when the C extension can't be built.
+    - 'python' is the pure Python version, `FastMonopoly` unless it needs to
+      record visit stats or traces (`tracking`).
+    - 'auto' is the first of 'cython', 'numba' and 'python' that is available.
+When the engine that was requested isn't available the next one in the 'auto'
+order is used. 'lanes' and 'numba' can't record visit stats or traces, so then
+the next engine that can is used.
 
 * Doing this inside a function also prevents the text that is printed from
   being printed multiple times when run in parallel (with multiprocessing)
 """
-def get_monopoly_cls(pure_python=False):
-    if pure_python:
+def get_monopoly_cls(engine="auto", tracking=False):
+    if engine == "python":
         console.print("-- Using Pure Python Monopoly class --", style="yellow")
-        return PyMonopoly
-    else:
-        if CMonopoly is not None:
-            return CMonopoly
+        return PyMonopoly if tracking else FastMonopoly
+    if CMonopoly is not None and engine != "numba":
+        if engine == "lanes":
+            if tracking:
+                console.print("-- The lanes engine can't record visit stats or traces, using the Cython engine --", style="yellow")
+                return CMonopoly
+            console.print(f"-- Using the lanes engine ({LANES} games per process) --", style="yellow")
+            return LaneMonopoly
+        return CMonopoly
+    NumbaMonopoly = load_numba_monopoly()
+    if NumbaMonopoly is not None and not tracking:
+        if engine == "numba":
+            console.print("-- Using Numba Monopoly class --", style="yellow")
         else:
-            console.print("-- Falling back to Pure Python Monopoly class --", style="yellow")
-            return PyMonopoly
+            console.print("-- Falling back to Numba Monopoly class --", style="yellow")
+        return NumbaMonopoly
+    if CMonopoly is not None: # only when 'numba' was requested
+        reason = "can't record visit stats or traces" if NumbaMonopoly is not None else "isn't installed"
+        console.print(f"-- The Numba engine {reason}, using the Cython engine --", style="yellow")
+        return CMonopoly
+    if NumbaMonopoly is not None:
+        console.print("-- The Numba engine can't record visit stats or traces --", style="yellow")
+    console.print("-- Falling back to Pure Python Monopoly class --", style="yellow")
+    return PyMonopoly if tracking else FastMonopoly
 
 """
-Returns a generator that yields a tuple containing a new Monopoly object and the
-number of turns to simulate for that game.
+Returns a generator that yields a tuple containing a new Monopoly object, playing
+by `rules`, the number of turns to simulate for that game and, if there are
+`snapshot_senders`, where to send its snapshots. With `trace_paths` each game
+records its trace to the path at the same index.
 """
-def generate_games(monopoly_cls, turns):
+def generate_games(monopoly_cls, turns, rules=None, track_visits=False, snapshot_senders=None, trace_paths=None):
     i=0
     while i < len(turns):
-        game = monopoly_cls()
-        yield game, turns[i]
+        game = monopoly_cls(rules, track_visits, trace_paths[i] if trace_paths else None)
+        if snapshot_senders is None:
+            yield game, turns[i]
+        else:
+            yield game, turns[i], snapshot_senders[i]
         i+=1
+
+"""
+Returns a generator like `generate_games`, but for `num_games` games that are
+played for `time_budget` seconds instead of for a number of turns.
+"""
+def generate_timed_games(monopoly_cls, num_games, time_budget, rules=None, track_visits=False, trace_paths=None):
+    for i in range(num_games):
+        yield monopoly_cls(rules, track_visits, trace_paths[i] if trace_paths else None), time_budget
+
 """
 Calls the game's `take_turns` method with the value from `turns`. Then returns
-the results list. This is needed as the function that gets passed to starmap.
+a `GameOutput` with the results list. This is needed as the function that gets
+passed to starmap.
+
+With a `snapshot_sender` the turns are taken in steps, sending the results so far
+at each of its checkpoints.
 """
-def play_game(game, turns):
+def play_game(game, turns, snapshot_sender=None):
+    start, cpu_start = time.perf_counter(), time.process_time()
+    if snapshot_sender is not None:
+        for checkpoint_index, checkpoint in enumerate(snapshot_sender.checkpoints):
+            game.take_turns(checkpoint)
+            snapshot_sender.send(checkpoint_index, game.results)
     game.take_turns(turns)
-    return game.results
+    return game_output(game, start, cpu_start)
+
+"""
+Plays the game in chunks for `time_budget` seconds, then returns a `GameOutput`
+like `play_game`. The clock only starts once the worker is ready: a throwaway
+game of `WARM_UP_TURNS` turns is played first, so starting the process and
+loading (or compiling) the engine don't use up the time. Each chunk is sized from
+how fast the last one went (the first from the warm up) to take about
+`TIME_BUDGET_CHUNK_SECONDS`, or what is left of the time if that is less, so the
+game stops close to the deadline without checking the time every turn.
+"""
+def play_game_until(game, time_budget):
+    type(game)().take_turns(WARM_UP_TURNS) # compiles the Numba engine
+    start = time.perf_counter()
+    type(game)().take_turns(WARM_UP_TURNS)
+    duration = time.perf_counter() - start
+    game_start, cpu_start = time.perf_counter(), time.process_time()
+    deadline = game_start + time_budget
+    turns = 0
+    chunk_turns = WARM_UP_TURNS
+    while True:
+        turns_per_sec = chunk_turns/duration if duration > 0 else chunk_turns/TIME_BUDGET_CHUNK_SECONDS
+        remaining = deadline - time.perf_counter()
+        if remaining <= 0:
+            break
+        chunk_turns = max(1, int(turns_per_sec*min(TIME_BUDGET_CHUNK_SECONDS, remaining)))
+        start = time.perf_counter()
+        turns += chunk_turns
+        game.take_turns(turns)
+        duration = time.perf_counter() - start
+    return game_output(game, game_start, cpu_start)
+
+"""
+Returns the `GameOutput` of a game that started playing at `start`
+(`time.perf_counter()`) and `cpu_start` (`time.process_time()`).
+"""
+def game_output(game, start, cpu_start):
+    results = list(game.results)
+    stats = WorkerStats(os.getpid(), sum(results), time.perf_counter() - start, time.process_time() - cpu_start, peak_rss())
+    if game.track_visits:
+        return GameOutput(results, list(game.visit_gaps), list(game.jail_stays), [stats])
+    return GameOutput(results, None, None, [stats])
+
+"""
+Returns the most memory this process has used at once (its peak RSS) in bytes,
+or `None` if that can't be measured.
+"""
+def peak_rss():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak*1024 # macOS reports bytes, Linux kilobytes
+
+"""
+Add up the outputs from all of the games, square by square (and bucket by
+bucket). The stats of each game are kept in a list. With no games (0 turns) the
+output is empty, like the results.
+"""
+def combine_outputs(outputs):
+    def combine(lists):
+        if any(values is None for values in lists):
+            return None
+        return [sum(values) for values in zip(*lists)]
+    outputs = list(outputs)
+    if not outputs:
+        return GameOutput([], None, None, [])
+    results, visit_gaps, jail_stays = (combine(lists) for lists in zip(*(output[:3] for output in outputs)))
+    return GameOutput(results, visit_gaps, jail_stays, [stats for output in outputs for stats in output.worker_stats])
 
 """
 Given a value and a label for that value, make the label plural if the value is
@@ -246,16 +442,27 @@ def pluralize(value, label, format=None, highlight=False):
         value_str = f"[bold]{value_str}[/bold]"
     return f"{value_str} {label}{'s' if value != 1 else ''}"
 
+def pretty_duration(duration, highlight=False):
+    if duration is None:
+        return ''
+    duration_str = ''
+    mins, secs = divmod(duration, 60)
+    if mins > 0:
+        duration_str = f"{pluralize(mins,'min','.0f',highlight)} "
+    format = '.0f' if mins > 0 else '.2f'
+    duration_str += f"{pluralize(secs,'sec',format,highlight)}"
+    return duration_str
+
 """
 Calculate how many games to play and how many turns in each game.
 If not running in parallel we only want one game, if we are running in parallel
 we will play at most, the same number of games as cpu_count. When dividing the
-turns up amonst games, the fewest number of turns in a game is 1,000,000.
+turns up amonst games, the fewest number of turns in a game is `min_game_turns`.
 """
-def calculate_all_turns(total_turns, cpu_count):
+def calculate_all_turns(total_turns, cpu_count, min_game_turns=1000000):
     turns = []
     turns_remaining = total_turns
-    turns_per_game = max(1000000, total_turns//cpu_count)
+    turns_per_game = max(min_game_turns, total_turns//cpu_count)
 
     while len(turns) < cpu_count and turns_remaining > 0:
         game_turns = min(turns_per_game, turns_remaining)
@@ -329,17 +536,75 @@ def make_chart(result, board_spaces):
     return chart
 
 """
-Save the results from the simulation to a txt and a csv file
+Returns the name and color of every square. The file is only read the first
+time, after that the same tuple is returned.
 """
-def save_results(result, results_dir=None):
+@lru_cache(maxsize=None)
+def load_board_spaces():
+    # This should be changed to use the newer 'files()' api, but PyOxidizer
+    # doesn't yet support it
+    with resources.open_text(data, 'board-spaces.txt') as fp_board_spaces:
+        return tuple(BoardSpace(*value.rstrip().split(":")) for value in fp_board_spaces)
+
+"""
+Returns the price, cost of a house and rents of every property. Like the board
+spaces, the file is only read the first time.
+"""
+@lru_cache(maxsize=None)
+def load_property_rents():
+    properties = []
+    with resources.open_text(data, 'property-rents.txt') as fp_property_rents:
+        for value in fp_property_rents:
+            kind, square, price, build_cost, rents = value.rstrip().split(":")
+            properties.append(Property(kind, int(square), int(price), int(build_cost), tuple(int(rent) for rent in rents.split(","))))
+    return tuple(properties)
+
+"""
+Returns the paths for each game to record its trace to, in a 'trace' directory
+inside the results directory. Any old traces there are removed since the games
+append to their files.
+"""
+def make_trace_paths(num_games, results_dir=None):
+    trace_dir = make_results_dir(results_dir) / 'trace'
+    trace_dir.mkdir(exist_ok=True)
+    for old_trace in trace_dir.glob('game-*.trace'):
+        old_trace.unlink()
+    return [str(trace_dir / f'game-{i}.trace') for i in range(num_games)]
+
+"""
+Write the file that describes the traces the games recorded, so they can be read
+back later (see trace.py).
+"""
+def save_trace_info(trace_paths, rules):
+    trace_dir = Path(trace_paths[0]).parent
+    info = {"rules": rules.name, "games": [Path(trace_path).name for trace_path in trace_paths]}
+    (trace_dir / TRACE_INFO).write_text(json.dumps(info, indent=4))
+    console.print(" •", f"{trace_dir.name}/", style="cyan")
+
+"""
+Returns the directory for things that are worked out once and kept between runs.
+It might not exist yet.
+"""
+def cache_dir():
+    if os.name == 'nt':
+        cache_dir = os.getenv("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+    else:
+        cache_dir = os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_dir) / "monopoly-probabilities"
+
+def make_results_dir(results_dir=None):
     results_dir = results_dir or 'results'
     results_dir = Path(results_dir).resolve()
     results_dir.mkdir(parents=True, exist_ok=True)
+    return results_dir
 
-    # This should be changed to use the newer 'files()' api, but PyOxidizer
-    # doesn't yet support it
-    with resources.open_text(data, 'board-spaces.txt') as fp_board_spaces:
-        board_spaces = [BoardSpace(*value.rstrip().split(":")) for value in fp_board_spaces]
+"""
+Save the results from the simulation to a txt and a csv file
+"""
+def save_results(result, results_dir=None):
+    results_dir = make_results_dir(results_dir)
+
+    board_spaces = load_board_spaces()
 
     console.print(f"\n[bold]Saving in[/] [magenta]{results_dir}[/]:")
 
@@ -357,3 +622,49 @@ def save_results(result, results_dir=None):
     probs_svg_chart = results_dir / 'board-probabilities-chart.svg'
     chart.render_to_file(str(probs_svg_chart))
     console.print(" •", probs_svg_chart.name, style="cyan")
+
+    if result.visit_gaps is not None:
+        save_visit_stats(result, results_dir)
+
+"""
+Save the probabilities for each of the first turns of a game to a csv file, with
+one row per turn and one column per square.
+"""
+def save_turn_distributions(distributions, results_dir=None):
+    results_dir = make_results_dir(results_dir)
+    board_spaces = load_board_spaces()
+
+    console.print(f"\n[bold]Saving in[/] [magenta]{results_dir}[/]:")
+
+    probs_csv = results_dir / 'board-probabilities-by-turn.csv'
+    with probs_csv.open('w') as fprobs_csv:
+        fprobs_csv.write(",".join(["Turn"] + [board_space.name for board_space in board_spaces]) + "\n")
+        for turn, percentages in enumerate(distributions, 1):
+            fprobs_csv.write(",".join([str(turn)] + [f"{percentage:.3%}" for percentage in percentages]) + "\n")
+    console.print(" •", probs_csv.name, style="cyan")
+
+"""
+Save the visit statistics to csv files. For each square, how many times it took
+1, 2, 3... turns to get back to it, and how many stays in jail lasted 1, 2, 3...
+turns. The last column of each counts everything longer too.
+"""
+def save_visit_stats(result, results_dir=None):
+    results_dir = make_results_dir(results_dir)
+    board_spaces = load_board_spaces()
+
+    return_times_csv = results_dir / 'board-return-times.csv'
+    with return_times_csv.open('w') as freturn_csv:
+        gap_labels = [str(gap) for gap in range(1, VISIT_GAP_BUCKETS)] + [f"{VISIT_GAP_BUCKETS}+"]
+        freturn_csv.write(",".join(["Square"] + gap_labels) + "\n")
+        for square, board_space in enumerate(board_spaces):
+            gaps = result.visit_gaps[square*VISIT_GAP_BUCKETS:(square+1)*VISIT_GAP_BUCKETS]
+            freturn_csv.write(",".join([board_space.name] + [str(count) for count in gaps]) + "\n")
+    console.print(" •", return_times_csv.name, style="cyan")
+
+    jail_stays_csv = results_dir / 'jail-stays.csv'
+    with jail_stays_csv.open('w') as fjail_csv:
+        fjail_csv.write("Turns In Jail,Stays\n")
+        for turns, count in enumerate(result.jail_stays, 1):
+            label = f"{turns}+" if turns == JAIL_STAY_BUCKETS else str(turns)
+            fjail_csv.write(f"{label},{count}\n")
+    console.print(" •", jail_stays_csv.name, style="cyan")
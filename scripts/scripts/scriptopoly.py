@@ -8,7 +8,7 @@ from .utils import (
 from contextlib import contextmanager
 from pathlib import Path
 from shlex import split
-import sys, shutil, os, glob
+import sys, shutil, os, glob, subprocess
 
 PYINSTALLER_BUILD_DIR = os.getenv("PYINSTALLER_BUILD_DIR", "pyinstaller-build")
 PYOXIDIZER_BUILD_DIR = os.getenv("PYOXIDIZER_BUILD_DIR", "pyoxidizer-build")
@@ -44,13 +44,16 @@ BUILD_ARTIFACTS = [
     PYOXIDIZER_BUILD_DIR,
     NUITKA_BUILD_DIR,
     "app/cython_ext/*.so",
-    "app/cython_ext/*.pyd"
+    "app/cython_ext/*.pyd",
+    "app/cython_ext/*/*.so",
+    "app/cython_ext/*/*.pyd"
 ]
 
 PYINSTALLER_BUILD_COMMAND = f"""
 {PYINSTALLER} {PYINSTALLER_BUILD_DIR}/monopoly.py
     --add-data {PYINSTALLER_BUILD_DIR}/app/data/{os.pathsep}app/data
     --collect-data pygal
+    --collect-submodules app.cython_ext
     --distpath {{}}
     --workpath {PYINSTALLER_BUILD_DIR}/build
     -F
@@ -64,26 +67,31 @@ NUITKA_BUILD_COMMAND = f"""
 -m nuitka --onefile --assume-yes-for-downloads
     --include-data-file={NUITKA_BUILD_DIR}/app/data/*.txt=app/data/
     --include-package-data=pygal
+    --include-package=app.cython_ext
     --output-dir={NUITKA_BUILD_DIR}/build
     {NUITKA_BUILD_DIR}/monopoly.py
 """
 
 @contextmanager
-def extension_manager(build=True):
+def extension_manager(build=True, pgo=False):
     if build:
         os.environ["BUILD_EXTENSION"] = "1"
+        if pgo:
+            os.environ["BUILD_EXTENSION_PGO"] = "1"
     try:
         yield
     finally:
-        if "BUILD_EXTENSION" in os.environ:
-            del os.environ["BUILD_EXTENSION"]
+        for env_var in ("BUILD_EXTENSION", "BUILD_EXTENSION_PGO"):
+            if env_var in os.environ:
+                del os.environ[env_var]
 
 script_parser = DecoratedArgParse(description="Helper script to perform various tasks for monopoly.")
 
 @script_parser.parser(help_desc="Build the C extension version of the monopoly object.")
+@script_parser.argument("--pgo", help="Use profile-guided optimization when building the extension (GCC only).", action="store_true")
 def build(args, env):
     print("--- Building monopoly object C extension ---")
-    with extension_manager():
+    with extension_manager(pgo=args.pgo):
         env.setup_py("build_ext", "-i", "-f")
     print("--- Done ---")
 
@@ -119,6 +127,19 @@ def monopolize(args, env):
     cythonize("app/cython_ext/monopoly.pyx", annotate=True)
     print("--- Done ---")
 
+@script_parser.parser(help_desc="Check that every available engine plays the same game.")
+@script_parser.argument("--turns", help="The number of turns each engine plays for each set of rules. (Default: 10,000,000)", type=int, default=10000000)
+@script_parser.argument("--seed", help="The seed for the random number generator. (Default: 2022)", type=int, default=2022)
+def verify(args, env):
+    try:
+        env.python("-c", "import numpy")
+    except subprocess.CalledProcessError:
+        print("--- numpy not installed...installing now ---")
+        env.pip("install", "--use-pep517", "-e", ".[analysis]")
+    print("--- Checking the engines against each other and the exact probabilities ---")
+    env.python("-m", "app.equivalence", "--turns", str(args.turns), "--seed", str(args.seed))
+    print("--- Done ---")
+
 @script_parser.parser(help_desc="Build a monopoly binary with PyInstaller.")
 @script_parser.argument("--distpath", help="Where to put the binary build. (Default: dist)", default="dist")
 @script_parser.argument("--no-extension", help="Build the binary without the C extension.", action="store_false")
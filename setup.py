@@ -1,13 +1,121 @@
 # -*- coding: utf-8 -*-
 from setuptools import setup
 from setuptools import Extension
-import os
+from setuptools.command.build_ext import build_ext
+from importlib import util
+from pathlib import Path
+import os, sys, subprocess
 
 setup_kwargs = {}
 
+EXTENSION_SOURCES = ["app/cython_ext/monopoly.cpp"]
+
+# Compiler flags for each optimized variant of the extension, by compiler type.
+# The variants get their own subpackage so each build keeps the 'monopoly'
+# module name it was compiled with.
+VARIANT_COMPILE_ARGS = {
+    "x86_64_v3": {
+        "unix": ["-O3", "-march=x86-64-v3"],
+        "msvc": ["/O2", "/arch:AVX2"],
+    },
+}
+
+# The workload that is run to collect the profile for a PGO build. It loads the
+# freshly built extension straight from its file and plays both sets of rules.
+PGO_WORKLOAD = """
+import sys
+from importlib import util
+from app.rules import STANDARD_RULES, REFERENCE_RULES
+spec = util.spec_from_file_location("app.cython_ext.monopoly", sys.argv[1])
+monopoly = util.module_from_spec(spec)
+spec.loader.exec_module(monopoly)
+monopoly.Monopoly(STANDARD_RULES).take_turns(10000000)
+monopoly.Monopoly(REFERENCE_RULES).take_turns(2000000)
+"""
+
+def load_cpu_module():
+    # Can't import app.cython_ext.cpu normally, the app package needs the runtime
+    # dependencies, which aren't there when building.
+    spec = util.spec_from_file_location("cpu", "app/cython_ext/cpu.py")
+    cpu = util.module_from_spec(spec)
+    spec.loader.exec_module(cpu)
+    return cpu
+
+def variant_name(ext):
+    parts = ext.name.split(".")
+    return parts[-2] if parts[-2] in VARIANT_COMPILE_ARGS else "generic"
+
+"""
+Builds each variant of the extension with its own flags. When the
+BUILD_EXTENSION_PGO environment variable is set (and the compiler is GCC) the
+extensions are built twice, once instrumented to run the PGO workload and then
+again using the profile it generated.
+"""
+class build_ext_variants(build_ext):
+    def run(self):
+        self.pgo_args = []
+        if os.getenv("BUILD_EXTENSION_PGO"):
+            if self.compiler_is_gcc():
+                self.run_pgo()
+                return
+            print("--- PGO builds are only supported with GCC, building without a profile ---")
+        super().run()
+
+    def compiler_is_gcc(self):
+        if self.compiler not in (None, "unix"):
+            return False
+        cc = os.getenv("CC") or "cc"
+        try:
+            version = subprocess.run([cc, "--version"], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True).stdout
+        except OSError:
+            return False
+        return "clang" not in version and ("gcc" in version.lower() or "free software foundation" in version.lower())
+
+    def run_pgo(self):
+        profile_dir = (Path(self.build_temp) / "pgo-profile").resolve()
+        supported_variants = load_cpu_module().supported_variants()
+
+        print("--- Building instrumented extension for PGO ---")
+        compiler = self.compiler # 'run' replaces this with the compiler object
+        self.pgo_args = [f"-fprofile-generate={profile_dir}"]
+        self.force = True
+        super().run()
+
+        print("--- Running PGO workload ---")
+        for ext in self.extensions:
+            variant = variant_name(ext)
+            if variant != "generic" and variant not in supported_variants:
+                print(f"--- Skipping '{variant}' workload, this CPU can't run it ---")
+                continue
+            ext_path = Path(self.get_ext_fullpath(ext.name)).resolve()
+            subprocess.run([sys.executable, "-c", PGO_WORKLOAD, str(ext_path)], check=True)
+
+        print("--- Building extension with PGO profile ---")
+        self.pgo_args = [f"-fprofile-use={profile_dir}", "-fprofile-correction", "-Wno-missing-profile"]
+        self.compiler = compiler
+        super().run()
+
+    def build_extension(self, ext):
+        variant = variant_name(ext)
+        compile_args = VARIANT_COMPILE_ARGS.get(variant, {}).get(self.compiler.compiler_type, [])
+        ext.extra_compile_args = compile_args + self.pgo_args
+        ext.extra_link_args = self.pgo_args
+        # All the variants share a source file, give each its own object files
+        # (and PGO profile)
+        build_temp = self.build_temp
+        self.build_temp = os.path.join(build_temp, variant)
+        try:
+            super().build_extension(ext)
+        finally:
+            self.build_temp = build_temp
+
 if os.getenv("BUILD_EXTENSION"):
+    ext_modules = [Extension("app.cython_ext.monopoly", EXTENSION_SOURCES)]
+    if load_cpu_module().is_x86_64():
+        ext_modules += [Extension(f"app.cython_ext.{variant}.monopoly", EXTENSION_SOURCES) for variant in VARIANT_COMPILE_ARGS]
     setup_kwargs.update(
-        ext_modules = [Extension("app.cython_ext.monopoly", ["app/cython_ext/monopoly.cpp"])]
+        ext_modules = ext_modules,
+        cmdclass = {"build_ext": build_ext_variants}
     )
 
 setup(**setup_kwargs)